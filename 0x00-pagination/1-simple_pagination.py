@@ -9,7 +9,8 @@ index ranges for pagination.
 
 import csv
 import math
-from typing import List, Tuple
+from itertools import islice
+from typing import Iterator, List, Tuple
 
 
 def index_range(page: int, page_size: int) -> Tuple[int, int]:
@@ -76,3 +77,74 @@ class Server:
         if start_index >= len(dataset):
             return []
         return dataset[start_index:end_index]
+
+    def iter_pages(self, page_size: int = 10, start: int = 0,
+                   stream: bool = False) -> Iterator[List[List]]:
+        """
+        Iterate over the dataset in consecutive pages.
+
+        Arguments are validated once, instead of on every get_page call.
+
+        Args:
+            page_size (int): The number of items per page (default 10).
+            start (int): The index of the first row to yield (default 0).
+            stream (bool): Read rows straight from the CSV file instead of
+                           the cached dataset, holding only one page in
+                           memory (default False).
+
+        Yields:
+            List[List]: The rows of each page; the last one may be short.
+
+        Raises:
+            AssertionError: If page_size is not positive or start negative.
+        """
+        assert isinstance(page_size, int), "page_size must be an integer"
+        assert isinstance(start, int), "start must be an integer"
+        assert page_size > 0, "page_size must be greater than 0"
+        assert start >= 0, "start must be non-negative"
+
+        if not stream:
+            dataset = self.dataset()
+            for index in range(start, len(dataset), page_size):
+                yield dataset[index:index + page_size]
+            return
+
+        with open(self.DATA_FILE) as f:
+            reader = csv.reader(f)
+            # Skip the header, then the rows before the start cursor
+            next(reader, None)
+            next(islice(reader, start, start), None)
+            while True:
+                page = list(islice(reader, page_size))
+                if not page:
+                    return
+                yield page
+
+    def iter_batches(self, page_size: int = 10, pages: int = 100,
+                     start: int = 0,
+                     stream: bool = False) -> Iterator[List[List[List]]]:
+        """
+        Iterate over the dataset several pages at a time.
+
+        Args:
+            page_size (int): The number of items per page (default 10).
+            pages (int): The number of pages per batch (default 100).
+            start (int): The index of the first row to yield (default 0).
+            stream (bool): Read rows straight from the CSV file, see
+                           iter_pages (default False).
+
+        Yields:
+            List[List[List]]: Up to `pages` consecutive pages.
+
+        Raises:
+            AssertionError: If an argument is out of range.
+        """
+        assert isinstance(pages, int), "pages must be an integer"
+        assert pages > 0, "pages must be greater than 0"
+
+        iterator = self.iter_pages(page_size, start, stream)
+        while True:
+            batch = list(islice(iterator, pages))
+            if not batch:
+                return
+            yield batch
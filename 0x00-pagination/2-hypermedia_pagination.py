@@ -4,12 +4,22 @@ Module for hypermedia pagination of a baby names dataset.
 
 This module provides a Server class to paginate data from
 Popular_Baby_Names.csv, with helper functions for index ranges
-and hypermedia metadata.
+and hypermedia metadata, including opaque keyset cursors and filtered
+views backed by secondary indexes.
 """
 
+import base64
 import csv
+import hashlib
+import hmac
+import json
 import math
-from typing import List, Tuple, Dict
+import os
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 
 def index_range(page: int, page_size: int) -> Tuple[int, int]:
@@ -29,12 +39,94 @@ def index_range(page: int, page_size: int) -> Tuple[int, int]:
     return (start_index, end_index)
 
 
+class SecondaryIndexes:
+    """
+    Row-id indexes over the baby names dataset, built once.
+
+    Year, gender and ethnicity map each value to the sorted row ids
+    holding it; first names are kept as a sorted (casefolded name,
+    row id) list, so a name prefix is a bisect range.
+    """
+    COLUMNS = {"year": 0, "gender": 1, "ethnicity": 2}
+    NAME = 3
+
+    def __init__(self, dataset: List[List]):
+        self.dataset = dataset
+        self.postings: Dict[str, Dict[str, array]] = {
+            column: {} for column in self.COLUMNS}
+        for row_id, row in enumerate(dataset):
+            for column, field in self.COLUMNS.items():
+                postings = self.postings[column]
+                if row[field] not in postings:
+                    postings[row[field]] = array("I")
+                postings[row[field]].append(row_id)
+        names = sorted((row[self.NAME].casefold(), row_id)
+                       for row_id, row in enumerate(dataset))
+        self.names = [name for name, _ in names]
+        self.name_rows = array("I", (row_id for _, row_id in names))
+
+    def prefix_rows(self, prefix: str) -> List[int]:
+        """
+        Row ids whose first name starts with a prefix, ignoring case.
+
+        Args:
+            prefix (str): The name prefix.
+
+        Returns:
+            List[int]: The matching row ids, sorted.
+        """
+        prefix = prefix.casefold()
+        start = bisect_left(self.names, prefix)
+        end = bisect_left(self.names, prefix + "\U0010ffff", start)
+        return sorted(self.name_rows[start:end])
+
+    def lookup(self, filters: Dict[str, str]) -> Sequence[int]:
+        """
+        Row ids matching every filter, in dataset order.
+
+        The smallest candidate list is scanned and its rows checked
+        against the remaining filters.
+
+        Args:
+            filters (Dict[str, str]): Normalized column filters.
+
+        Returns:
+            Sequence[int]: The matching row ids.
+        """
+        candidates = []
+        for column, value in filters.items():
+            if column == "name_prefix":
+                candidates.append(self.prefix_rows(value))
+            else:
+                candidates.append(self.postings[column].get(value, ()))
+        if not candidates:
+            return range(len(self.dataset))
+        smallest = min(candidates, key=len)
+        checks = [(self.COLUMNS[column], value)
+                  for column, value in filters.items()
+                  if column != "name_prefix"]
+        prefix = filters.get("name_prefix", "").casefold()
+        return array("I", (
+            row_id for row_id in smallest
+            if all(self.dataset[row_id][field] == value
+                   for field, value in checks) and
+            self.dataset[row_id][self.NAME].casefold().startswith(prefix)))
+
+
 class Server:
     """Server class to paginate a database of popular baby names."""
     DATA_FILE = "Popular_Baby_Names.csv"
+    CURSOR_SECRET_ENV = "PAGINATION_CURSOR_SECRET"
+    FILTERS = ("year", "gender", "ethnicity", "name_prefix")
+    QUERY_CACHE_SIZE = 128
 
     def __init__(self):
         self.__dataset = None
+        self.__indexes = None
+        self.__queries = OrderedDict()
+        # Without a shared secret, cursors are only valid in this process
+        secret = os.environ.get(self.CURSOR_SECRET_ENV)
+        self.__secret = secret.encode() if secret else os.urandom(32)
 
     def dataset(self) -> List[List]:
         """
@@ -50,13 +142,65 @@ class Server:
             self.__dataset = dataset[1:]
         return self.__dataset
 
-    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
+    def indexes(self) -> SecondaryIndexes:
+        """
+        Retrieve and cache the secondary indexes of the dataset.
+
+        Returns:
+            SecondaryIndexes: The indexes.
+        """
+        if self.__indexes is None:
+            self.__indexes = SecondaryIndexes(self.dataset())
+        return self.__indexes
+
+    def query(self, **filters) -> Sequence[int]:
+        """
+        Row ids matching the filters, cached per distinct filter set.
+
+        Args:
+            year (int or str, optional): Year of birth.
+            gender (str, optional): Gender, case-insensitive.
+            ethnicity (str, optional): Ethnicity, case-insensitive.
+            name_prefix (str, optional): Start of the first name,
+                                         case-insensitive.
+
+        Returns:
+            Sequence[int]: The matching row ids, in dataset order.
+
+        Raises:
+            AssertionError: If an unknown filter is given.
+        """
+        for name in filters:
+            assert name in self.FILTERS, f"unknown filter {name}"
+        normalized = {}
+        for name, value in filters.items():
+            if value is None:
+                continue
+            value = str(value)
+            normalized[name] = value.upper() if name in (
+                "gender", "ethnicity") else value
+        key = tuple(sorted(normalized.items()))
+        rows = self.__queries.get(key)
+        if rows is None:
+            rows = self.indexes().lookup(normalized)
+            self.__queries[key] = rows
+            if len(self.__queries) > self.QUERY_CACHE_SIZE:
+                self.__queries.popitem(last=False)
+        else:
+            self.__queries.move_to_end(key)
+        return rows
+
+    def get_page(self, page: int = 1, page_size: int = 10,
+                 **filters) -> List[List]:
         """
         Retrieve a specific page of the dataset.
 
         Args:
             page (int): The page number (1-indexed, default 1).
             page_size (int): The number of items per page (default 10).
+            filters: Optional year, gender, ethnicity and name_prefix
+                     filters, see query; the page is taken from the
+                     matching rows only.
 
         Returns:
             List[List]: The list of rows for the specified page, or an empty
@@ -73,17 +217,94 @@ class Server:
         start_index, end_index = index_range(page, page_size)
         dataset = self.dataset()
 
+        if filters:
+            rows = self.query(**filters)
+            return [dataset[i] for i in rows[start_index:end_index]]
         if start_index >= len(dataset):
             return []
         return dataset[start_index:end_index]
 
-    def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict[str, any]:
+    def iter_pages(self, page_size: int = 10, start: int = 0,
+                   stream: bool = False) -> Iterator[List[List]]:
+        """
+        Iterate over the dataset in consecutive pages.
+
+        Arguments are validated once, instead of on every get_page call.
+
+        Args:
+            page_size (int): The number of items per page (default 10).
+            start (int): The index of the first row to yield (default 0).
+            stream (bool): Read rows straight from the CSV file instead of
+                           the cached dataset, holding only one page in
+                           memory (default False).
+
+        Yields:
+            List[List]: The rows of each page; the last one may be short.
+
+        Raises:
+            AssertionError: If page_size is not positive or start negative.
+        """
+        assert isinstance(page_size, int), "page_size must be an integer"
+        assert isinstance(start, int), "start must be an integer"
+        assert page_size > 0, "page_size must be greater than 0"
+        assert start >= 0, "start must be non-negative"
+
+        if not stream:
+            dataset = self.dataset()
+            for index in range(start, len(dataset), page_size):
+                yield dataset[index:index + page_size]
+            return
+
+        with open(self.DATA_FILE) as f:
+            reader = csv.reader(f)
+            # Skip the header, then the rows before the start cursor
+            next(reader, None)
+            next(islice(reader, start, start), None)
+            while True:
+                page = list(islice(reader, page_size))
+                if not page:
+                    return
+                yield page
+
+    def iter_batches(self, page_size: int = 10, pages: int = 100,
+                     start: int = 0,
+                     stream: bool = False) -> Iterator[List[List[List]]]:
+        """
+        Iterate over the dataset several pages at a time.
+
+        Args:
+            page_size (int): The number of items per page (default 10).
+            pages (int): The number of pages per batch (default 100).
+            start (int): The index of the first row to yield (default 0).
+            stream (bool): Read rows straight from the CSV file, see
+                           iter_pages (default False).
+
+        Yields:
+            List[List[List]]: Up to `pages` consecutive pages.
+
+        Raises:
+            AssertionError: If an argument is out of range.
+        """
+        assert isinstance(pages, int), "pages must be an integer"
+        assert pages > 0, "pages must be greater than 0"
+
+        iterator = self.iter_pages(page_size, start, stream)
+        while True:
+            batch = list(islice(iterator, pages))
+            if not batch:
+                return
+            yield batch
+
+    def get_hyper(self, page: int = 1, page_size: int = 10,
+                  **filters) -> Dict[str, any]:
         """
         Retrieve a page of the dataset with hypermedia metadata.
 
         Args:
             page (int): The page number (1-indexed, default 1).
             page_size (int): The number of items per page (default 10).
+            filters: Optional filters, see get_page; total_pages then
+                     counts the matching rows, read from the query cache.
 
         Returns:
             Dict[str, any]: A dictionary containing page_size, page, data,
@@ -92,8 +313,11 @@ class Server:
         Raises:
             AssertionError: If page or page_size is not a positive integer.
         """
-        data = self.get_page(page, page_size)
-        dataset_size = len(self.dataset())
+        data = self.get_page(page, page_size, **filters)
+        if filters:
+            dataset_size = len(self.query(**filters))
+        else:
+            dataset_size = len(self.dataset())
         total_pages = math.ceil(dataset_size / page_size)
 
         return {
@@ -104,3 +328,93 @@ class Server:
             'prev_page': page - 1 if page > 1 else None,
             'total_pages': total_pages
         }
+
+    def encode_cursor(self, direction: str, key: int) -> str:
+        """
+        Build an opaque, signed cursor.
+
+        Args:
+            direction (str): "after" to read rows following key,
+                             "before" to read rows preceding it.
+            key (int): The row index the page is anchored to.
+
+        Returns:
+            str: The URL-safe cursor.
+        """
+        payload = json.dumps([direction, key], separators=(",", ":"))
+        payload = base64.urlsafe_b64encode(payload.encode()).rstrip(b"=")
+        signature = hmac.new(self.__secret, payload, hashlib.sha256)
+        tag = base64.urlsafe_b64encode(signature.digest()[:16]).rstrip(b"=")
+        return (payload + b"." + tag).decode()
+
+    def decode_cursor(self, cursor: str) -> Tuple[str, int]:
+        """
+        Verify and unpack a cursor built by encode_cursor.
+
+        Args:
+            cursor (str): The cursor.
+
+        Returns:
+            Tuple[str, int]: The direction and the anchor row index.
+
+        Raises:
+            AssertionError: If the cursor is malformed or was tampered with.
+        """
+        assert isinstance(cursor, str), "cursor must be a string"
+        payload, _, tag = cursor.encode().partition(b".")
+        signature = hmac.new(self.__secret, payload, hashlib.sha256)
+        expected = base64.urlsafe_b64encode(
+            signature.digest()[:16]).rstrip(b"=")
+        assert hmac.compare_digest(tag, expected), "invalid cursor"
+        padded = payload + b"=" * (-len(payload) % 4)
+        direction, key = json.loads(base64.urlsafe_b64decode(padded))
+        assert direction in ("after", "before"), "invalid cursor"
+        return direction, key
+
+    def get_hyper_cursor(self, cursor: Optional[str] = None,
+                         page_size: int = 10) -> Dict[str, any]:
+        """
+        Retrieve a page of the dataset by keyset cursor.
+
+        The cursor carries the last (or first) row index seen, so every
+        page is a direct seek: the cost is the same at any depth, and a
+        page never repeats or skips rows because of earlier ones moving.
+
+        Args:
+            cursor (str, optional): A next_cursor or prev_cursor from a
+                                    previous page; None for the first page.
+            page_size (int): The number of items per page (default 10).
+
+        Returns:
+            Dict[str, any]: A dictionary containing page_size, data,
+                            next_cursor and prev_cursor (None at either end).
+
+        Raises:
+            AssertionError: If page_size is not positive or the cursor is
+                            invalid.
+        """
+        assert isinstance(page_size, int), "page_size must be an integer"
+        assert page_size > 0, "page_size must be greater than 0"
+
+        direction, key = "after", -1
+        if cursor is not None:
+            direction, key = self.decode_cursor(cursor)
+
+        dataset = self.dataset()
+        if direction == "after":
+            start = key + 1
+            end = start + page_size
+        else:
+            end = key
+            start = max(0, end - page_size)
+        data = dataset[start:end]
+        end = start + len(data)
+
+        return {
+            'page_size': len(data),
+            'data': data,
+            'next_cursor': self.encode_cursor("after", end - 1)
+            if data and end < len(dataset) else None,
+            'prev_cursor': self.encode_cursor("before", start)
+            if data and start > 0 else None,
+        }
@@ -4,17 +4,243 @@ Deletion-resilient hypermedia pagination
 """
 
 import csv
+import heapq
 import math
-from typing import List, Dict
+from array import array
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Iterator, List
+
+
+class LiveIndex:
+    """
+    Fenwick tree over the live/deleted state of every row index.
+
+    Deleting, restoring, counting the live rows before an index and
+    finding the k-th live row all take O(log n).
+    """
+
+    def __init__(self, size: int):
+        # With every row live, node i covers (i & -i) rows
+        self.__tree = array("I", [0]) + array("I", (
+            i & -i for i in range(1, size + 1)))
+        self.__live = bytearray(b"\x01") * size
+        self.count = size
+
+    def __len__(self) -> int:
+        """Number of row indices, live or deleted."""
+        return len(self.__live)
+
+    def __contains__(self, index: int) -> bool:
+        """Whether an index exists and is live."""
+        return 0 <= index < len(self.__live) and self.__live[index] == 1
+
+    def __add(self, index: int, delta: int) -> None:
+        """Add delta to the count of one index."""
+        i = index + 1
+        while i < len(self.__tree):
+            self.__tree[i] += delta
+            i += i & -i
+
+    def __prefix(self, end: int) -> int:
+        """Sum of the counts of indices [0, end)."""
+        total = 0
+        i = end
+        while i > 0:
+            total += self.__tree[i]
+            i -= i & -i
+        return total
+
+    def delete(self, index: int) -> None:
+        """
+        Mark a live index as deleted.
+
+        Args:
+            index (int): The row index.
+        """
+        if index in self:
+            self.__live[index] = 0
+            self.count -= 1
+            self.__add(index, -1)
+
+    def restore(self, index: int) -> None:
+        """
+        Mark a deleted index as live again.
+
+        Args:
+            index (int): The row index.
+        """
+        if 0 <= index < len(self.__live) and not self.__live[index]:
+            self.__live[index] = 1
+            self.count += 1
+            self.__add(index, 1)
+
+    def append(self) -> int:
+        """
+        Add a new live index at the end.
+
+        Returns:
+            int: The new index.
+        """
+        index = len(self.__live)
+        i = index + 1
+        # Node i covers indices [i - lowbit(i), i), the new one included
+        self.__tree.append(self.__prefix(index) -
+                           self.__prefix(i - (i & -i)) + 1)
+        self.__live.append(1)
+        self.count += 1
+        return index
+
+    def rank(self, index: int) -> int:
+        """
+        Count the live indices before an index.
+
+        Args:
+            index (int): The row index.
+
+        Returns:
+            int: The number of live indices in [0, index).
+        """
+        return self.__prefix(min(index, len(self.__live)))
+
+    def select(self, k: int) -> int:
+        """
+        Find the k-th live index.
+
+        Args:
+            k (int): The 0-based rank, lower than the live count.
+
+        Returns:
+            int: The index of the k-th live row.
+        """
+        position = 0
+        step = 1 << (len(self.__tree) - 1).bit_length()
+        remaining = k + 1
+        while step:
+            node = position + step
+            if node < len(self.__tree) and self.__tree[node] < remaining:
+                position = node
+                remaining -= self.__tree[node]
+            step >>= 1
+        return position
+
+    def following(self, index: int, k: int) -> List[int]:
+        """
+        Find up to k live indices at or after an index.
+
+        Only the first one is a tree search; the others are found by
+        scanning the live flags forward from it.
+
+        Args:
+            index (int): The first candidate index.
+            k (int): The maximum number of indices.
+
+        Returns:
+            List[int]: The live indices, in order.
+        """
+        first = self.rank(index)
+        if first >= self.count or k <= 0:
+            return []
+        indices = [self.select(first)]
+        for _ in range(min(k, self.count - first) - 1):
+            indices.append(self.__live.find(1, indices[-1] + 1))
+        return indices
+
+
+class SortedView:
+    """
+    Dataset order by one integer column, as a compact permutation.
+
+    The permutation and its inverse are array('I'); a LiveIndex over
+    permutation positions lets deletes be applied in O(log n) instead
+    of rebuilding the view.
+    """
+
+    def __init__(self, dataset: List[List], live: LiveIndex, field: int,
+                 descending: bool):
+        keys = [int(row[field]) for row in dataset]
+        sign = -1 if descending else 1
+        self.order = array("I", sorted(range(len(dataset)),
+                                       key=lambda i: (sign * keys[i], i)))
+        self.position = array("I", bytes(4 * len(self.order)))
+        for position, row_id in enumerate(self.order):
+            self.position[row_id] = position
+        self.live = LiveIndex(len(self.order))
+        for row_id in range(len(self.order)):
+            if row_id not in live:
+                self.live.delete(self.position[row_id])
+
+    def delete(self, row_id: int) -> None:
+        """
+        Hide a deleted row from the view.
+
+        Args:
+            row_id (int): The index of the deleted row.
+        """
+        self.live.delete(self.position[row_id])
+
+    def rows(self, start: int, end: int) -> List[int]:
+        """
+        Row ids of the live rows ranked [start, end) in this order.
+
+        Args:
+            start (int): The first rank.
+            end (int): The rank after the last one.
+
+        Returns:
+            List[int]: The row ids.
+        """
+        return [self.order[self.live.select(rank)]
+                for rank in range(start, min(end, self.live.count))]
+
+
+class LiveRows(MutableMapping):
+    """
+    Read view mapping live row indices to rows, without copying rows.
+
+    Deleting an item goes through the given delete function, so it is
+    the same as calling Server.delete.
+    """
+
+    def __init__(self, dataset: List[List], live: LiveIndex,
+                 delete: Callable[[int], None]):
+        self.__dataset = dataset
+        self.__live = live
+        self.__delete = delete
+
+    def __getitem__(self, index: int) -> List:
+        if index not in self.__live:
+            raise KeyError(index)
+        return self.__dataset[index]
+
+    def __setitem__(self, index: int, row: List) -> None:
+        raise TypeError("use Server.insert to add rows")
+
+    def __delitem__(self, index: int) -> None:
+        if index not in self.__live:
+            raise KeyError(index)
+        self.__delete(index)
+
+    def __contains__(self, index: object) -> bool:
+        return isinstance(index, int) and index in self.__live
+
+    def __iter__(self) -> Iterator[int]:
+        return (i for i in range(len(self.__live)) if i in self.__live)
+
+    def __len__(self) -> int:
+        return self.__live.count
 
 
 class Server:
     """Server class to paginate a database of popular baby names."""
     DATA_FILE = "Popular_Baby_Names.csv"
+    SORT_KEYS = {"year": 0, "count": 4, "rank": 5}
 
     def __init__(self):
         self.__dataset = None
+        self.__live = None
         self.__indexed_dataset = None
+        self.__sorted_views = {}
+        self.__first_pages = {}
 
     def dataset(self) -> List[List]:
         """
@@ -30,24 +256,145 @@ class Server:
             self.__dataset = dataset[1:]
         return self.__dataset
 
+    def live_index(self) -> LiveIndex:
+        """
+        Live/deleted state of every row index, built once.
+
+        Returns:
+            LiveIndex: The Fenwick tree over the dataset.
+        """
+        if self.__live is None:
+            self.__live = LiveIndex(len(self.dataset()))
+        return self.__live
+
     def indexed_dataset(self) -> Dict[int, List]:
         """
         Dataset indexed by sorting position, starting at 0.
 
         Returns:
-            Dict[int, List]: A dictionary mapping indices to dataset rows.
+            Dict[int, List]: A read view mapping live indices to rows.
         """
         if self.__indexed_dataset is None:
-            dataset = self.dataset()
-            self.__indexed_dataset = {
-                i: dataset[i] for i in range(len(dataset))
-            }
+            self.__indexed_dataset = LiveRows(self.dataset(),
+                                              self.live_index(),
+                                              self.delete)
         return self.__indexed_dataset
 
+    def delete(self, index: int) -> None:
+        """
+        Delete the row at an index; other rows keep their indices.
+
+        Args:
+            index (int): The index of a live row.
+
+        Raises:
+            AssertionError: If index is not a live row.
+        """
+        assert index in self.live_index(), "index must be a live row"
+        self.live_index().delete(index)
+        for view in self.__sorted_views.values():
+            view.delete(index)
+        # Deleting a row outside a memoized first page leaves it correct
+        for key, row_ids in list(self.__first_pages.items()):
+            if index in row_ids:
+                del self.__first_pages[key]
+
+    def insert(self, row: List) -> int:
+        """
+        Append a row at a new index, after every existing one.
+
+        Args:
+            row (List): The row to add.
+
+        Returns:
+            int: The index of the new row.
+        """
+        live = self.live_index()
+        self.dataset().append(row)
+        # A new row lands anywhere in a sort order: rebuild lazily
+        self.__sorted_views.clear()
+        self.__first_pages.clear()
+        return live.append()
+
+    def sorted_view(self, sort_by: str,
+                    descending: bool = True) -> SortedView:
+        """
+        Retrieve and cache the permutation for one sort order.
+
+        Args:
+            sort_by (str): One of SORT_KEYS.
+            descending (bool): Largest values first (default True).
+
+        Returns:
+            SortedView: The view, kept in sync with later deletes.
+        """
+        key = (sort_by, descending)
+        if key not in self.__sorted_views:
+            self.__sorted_views[key] = SortedView(
+                self.dataset(), self.live_index(),
+                self.SORT_KEYS[sort_by], descending)
+        return self.__sorted_views[key]
+
+    def get_sorted_page(self, sort_by: str = "count", page: int = 1,
+                        page_size: int = 10,
+                        descending: bool = True) -> List[List]:
+        """
+        Retrieve a page of the live rows ordered by a numeric column.
+
+        Ties keep dataset order. The first page is served by a heap-based
+        top-k scan until the full permutation exists, so it never pays
+        for a sort; the scan's result is memoized until a delete or an
+        insert changes it. Later pages build the permutation once and
+        reuse it.
+
+        Args:
+            sort_by (str): "count", "rank" or "year" (default "count").
+            page (int): The page number (1-indexed, default 1).
+            page_size (int): The number of items per page (default 10).
+            descending (bool): Largest values first (default True).
+
+        Returns:
+            List[List]: The rows of the page, or an empty list if the page
+                        is out of range.
+
+        Raises:
+            AssertionError: If an argument is out of range.
+        """
+        assert sort_by in self.SORT_KEYS, "unknown sort key"
+        assert isinstance(page, int), "page must be an integer"
+        assert isinstance(page_size, int), "page_size must be an integer"
+        assert page > 0, "page must be greater than 0"
+        assert page_size > 0, "page_size must be greater than 0"
+
+        dataset = self.dataset()
+        live = self.live_index()
+        start = (page - 1) * page_size
+        key = (sort_by, descending)
+        if page == 1 and key not in self.__sorted_views:
+            row_ids = self.__first_pages.get(key)
+            # The top k of a total order starts with its top j, j < k
+            if row_ids is None or (len(row_ids) < page_size and
+                                   len(row_ids) < live.count):
+                field = self.SORT_KEYS[sort_by]
+                sign = -1 if descending else 1
+                row_ids = heapq.nsmallest(
+                    page_size, (i for i in range(len(dataset)) if i in live),
+                    key=lambda i: (sign * int(dataset[i][field]), i))
+                self.__first_pages[key] = row_ids
+            row_ids = row_ids[:page_size]
+        else:
+            view = self.sorted_view(sort_by, descending)
+            row_ids = view.rows(start, start + page_size)
+        return [dataset[i] for i in row_ids]
+
     def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
         """
         Retrieve a page of the dataset starting at the specified index.
 
+        The first live row at or after index is found in O(log n) no
+        matter how many rows were deleted; the rest of the page is read
+        by scanning forward from it.
+
         Args:
             index (int, optional): The starting index (0-based, default None).
                                    If None, starts at 0.
@@ -71,24 +418,18 @@ class Server:
         index = 0 if index is None else index
         assert index >= 0, "index must be non-negative"
 
-        indexed_data = self.indexed_dataset()
-        max_index = len(indexed_data)
+        dataset = self.dataset()
+        live = self.live_index()
+        max_index = len(live)
         assert index < max_index, "index out of range"
 
-        data = []
-        current_index = index
-        items_collected = 0
-        next_index = None
-
-        # Collect up to page_size items, skipping missing indices
-        while items_collected < page_size and current_index < max_index:
-            if current_index in indexed_data:
-                data.append(indexed_data[current_index])
-                items_collected += 1
-            current_index += 1
+        indices = live.following(index, page_size)
+        data = [dataset[i] for i in indices]
 
-        # Set next_index to the next valid index after the current page
-        next_index = current_index if current_index < max_index else None
+        # Set next_index to the index after the last row of the page
+        next_index = None
+        if len(indices) == page_size and indices[-1] + 1 < max_index:
+            next_index = indices[-1] + 1
 
         return {
             'index': index,
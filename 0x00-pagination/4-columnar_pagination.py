@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Module for columnar pagination of a baby names dataset.
+
+This module provides a ColumnarDataset that keeps Popular_Baby_Names.csv
+as typed columns instead of one list of strings per row, and a Server
+class paginating it. Rows are only rebuilt for the page being returned.
+The parsed columns are saved to a binary snapshot next to the CSV file,
+which later starts map instead of parsing the CSV again.
+"""
+
+import csv
+import math
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+
+def index_range(page: int, page_size: int) -> Tuple[int, int]:
+    """
+    Calculate the start and end indices for a given page and page size.
+
+    Args:
+        page (int): The page number (1-indexed).
+        page_size (int): The number of items per page.
+
+    Returns:
+        Tuple[int, int]: A tuple containing the start index and end index
+                         for the specified page.
+    """
+    start_index = (page - 1) * page_size
+    end_index = start_index + page_size
+    return (start_index, end_index)
+
+
+SNAPSHOT_MAGIC = b"COLSNAP2"
+# magic, CSV size, CSV mtime_ns, rows, crc32 of everything after the header
+SNAPSHOT_HEADER = struct.Struct("<8sQQQQ")
+
+
+class Categorical:
+    """Dictionary-encoded column: one small code per row plus a value table."""
+
+    def __init__(self, typecode: str = "B"):
+        self.codes = array(typecode)
+        self.values: List[str] = []
+        self.__lookup: Dict[str, int] = {}
+
+    def append(self, value: str) -> None:
+        """
+        Append a value, adding it to the value table if it is new.
+
+        Args:
+            value (str): The value to append.
+        """
+        code = self.__lookup.get(value)
+        if code is None:
+            code = self.__lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    @classmethod
+    def from_table(cls, codes: Sequence[int],
+                   values: List[str]) -> "Categorical":
+        """
+        Wrap existing codes and their value table.
+
+        Args:
+            codes (Sequence[int]): One code per row, for instance a
+                                   memoryview over a snapshot.
+            values (List[str]): The value of each code.
+
+        Returns:
+            Categorical: The column.
+        """
+        column = cls()
+        column.codes = codes
+        column.values = values
+        column.__lookup = {value: code for code, value in enumerate(values)}
+        return column
+
+    def __getitem__(self, index: int) -> str:
+        return self.values[self.codes[index]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class ColumnarDataset:
+    """
+    Typed, column-oriented copy of the baby names dataset.
+
+    Year, Count and Rank are unsigned integer arrays; Gender, Ethnicity
+    and the first name are dictionary-encoded. Name codes are 32-bit, as
+    a dataset may hold more than 65,535 distinct names.
+    """
+    COLUMNS = ("year", "gender", "ethnicity", "name", "count", "rank")
+
+    def __init__(self):
+        self.year = array("H")
+        self.gender = Categorical("B")
+        self.ethnicity = Categorical("B")
+        self.name = Categorical("I")
+        self.count = array("I")
+        self.rank = array("I")
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[str]]) -> "ColumnarDataset":
+        """
+        Build a dataset from CSV rows, excluding the header.
+
+        Args:
+            rows (Sequence[Sequence[str]]): The rows as lists of strings.
+
+        Returns:
+            ColumnarDataset: The encoded dataset.
+        """
+        dataset = cls()
+        for year, gender, ethnicity, name, count, rank in rows:
+            dataset.year.append(int(year))
+            dataset.gender.append(gender)
+            dataset.ethnicity.append(ethnicity)
+            dataset.name.append(name)
+            dataset.count.append(int(count))
+            dataset.rank.append(int(rank))
+        return dataset
+
+    @classmethod
+    def from_csv(cls, path: str) -> "ColumnarDataset":
+        """
+        Parse a CSV file, skipping its header, straight into columns.
+
+        Args:
+            path (str): The path of the CSV file.
+
+        Returns:
+            ColumnarDataset: The encoded dataset.
+        """
+        with open(path) as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            return cls.from_rows(reader)
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+    def __sections(self):
+        """Numeric sections in snapshot order, widest first for alignment."""
+        return ((self.count, "I"), (self.rank, "I"), (self.name.codes, "I"),
+                (self.year, "H"), (self.gender.codes, "B"),
+                (self.ethnicity.codes, "B"))
+
+    def save(self, path: str, source: str) -> None:
+        """
+        Write a binary snapshot atomically; a read-only directory is not fatal.
+
+        Args:
+            path (str): The path of the snapshot.
+            source (str): The CSV file the dataset was parsed from, whose
+                          size and modification time stamp the snapshot.
+        """
+        payload = [array(typecode, column).tobytes()
+                   for column, typecode in self.__sections()]
+        for column in (self.gender, self.ethnicity, self.name):
+            table = "\n".join(column.values).encode()
+            payload.append(struct.pack("<QQ", len(column.values),
+                                       len(table)) + table)
+        payload = b"".join(payload)
+        stat = os.stat(source)
+        header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, stat.st_size,
+                                      stat.st_mtime_ns, len(self),
+                                      zlib.crc32(payload))
+        # A temporary file of its own, as several processes may save at once
+        try:
+            descriptor, temporary = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(path)),
+                prefix=os.path.basename(path) + ".", suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "wb") as f:
+                    f.write(header)
+                    f.write(payload)
+                os.replace(temporary, path)
+            except OSError:
+                os.unlink(temporary)
+                raise
+        except OSError:
+            pass
+
+    @classmethod
+    def load(cls, path: str, source: str) -> "ColumnarDataset":
+        """
+        Map a binary snapshot if it is still valid for the CSV file.
+
+        Numeric columns are memoryviews over the mapped file, so nothing
+        but the string tables is copied.
+
+        Args:
+            path (str): The path of the snapshot.
+            source (str): The CSV file the snapshot must match.
+
+        Returns:
+            ColumnarDataset or None: The dataset, or None if the snapshot
+                                     is missing, stale or corrupt.
+        """
+        try:
+            stat = os.stat(source)
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        view = memoryview(mapped)
+        try:
+            magic, size, mtime_ns, rows, checksum = \
+                SNAPSHOT_HEADER.unpack_from(view)
+            if (magic != SNAPSHOT_MAGIC or
+                    (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns) or
+                    zlib.crc32(view[SNAPSHOT_HEADER.size:]) != checksum):
+                return None
+            dataset = cls()
+            offset = SNAPSHOT_HEADER.size
+            columns = []
+            for _, typecode in dataset.__sections():
+                end = offset + rows * struct.calcsize(typecode)
+                columns.append(view[offset:end].cast(typecode))
+                offset = end
+            tables = []
+            for _ in range(3):
+                count, length = struct.unpack_from("<QQ", view, offset)
+                offset += 16
+                table = bytes(view[offset:offset + length]).decode()
+                values = table.split("\n") if count else []
+                # A value holding a newline would shift every later code
+                if len(values) != count:
+                    return None
+                tables.append(values)
+                offset += length
+            if offset != len(view):
+                return None
+        except (struct.error, TypeError, UnicodeDecodeError):
+            return None
+        (dataset.count, dataset.rank, name,
+         dataset.year, gender, ethnicity) = columns
+        dataset.gender = Categorical.from_table(gender, tables[0])
+        dataset.ethnicity = Categorical.from_table(ethnicity, tables[1])
+        dataset.name = Categorical.from_table(name, tables[2])
+        return dataset
+
+    def row(self, index: int) -> List[str]:
+        """
+        Materialize one row in the same shape as the CSV reader.
+
+        Args:
+            index (int): The row index (0-based).
+
+        Returns:
+            List[str]: The row as a list of strings.
+        """
+        return [str(self.year[index]), self.gender[index],
+                self.ethnicity[index], self.name[index],
+                str(self.count[index]), str(self.rank[index])]
+
+    def rows(self, start: int, end: int) -> List[List[str]]:
+        """
+        Materialize the rows in [start, end).
+
+        Args:
+            start (int): The first row index.
+            end (int): The index after the last row.
+
+        Returns:
+            List[List[str]]: The rows, clipped to the dataset.
+        """
+        return [self.row(i) for i in range(start, min(end, len(self)))]
+
+
+class Server:
+    """Server class to paginate a database of popular baby names."""
+    DATA_FILE = "Popular_Baby_Names.csv"
+
+    def __init__(self):
+        self.__dataset = None
+
+    def dataset(self) -> ColumnarDataset:
+        """
+        Retrieve and cache the columnar dataset.
+
+        The dataset is mapped from the "<file>.snap" snapshot when it is
+        still valid; otherwise the CSV file is parsed and the snapshot
+        rewritten for the next start.
+
+        Returns:
+            ColumnarDataset: The dataset, excluding the header.
+        """
+        if self.__dataset is None:
+            snapshot = self.DATA_FILE + ".snap"
+            self.__dataset = ColumnarDataset.load(snapshot, self.DATA_FILE)
+            if self.__dataset is None:
+                self.__dataset = ColumnarDataset.from_csv(self.DATA_FILE)
+                self.__dataset.save(snapshot, self.DATA_FILE)
+        return self.__dataset
+
+    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
+        """
+        Retrieve a specific page of the dataset.
+
+        Args:
+            page (int): The page number (1-indexed, default 1).
+            page_size (int): The number of items per page (default 10).
+
+        Returns:
+            List[List]: The list of rows for the specified page, or an empty
+                        list if the page is out of range.
+
+        Raises:
+            AssertionError: If page or page_size is not a positive integer.
+        """
+        assert isinstance(page, int), "page must be an integer"
+        assert isinstance(page_size, int), "page_size must be an integer"
+        assert page > 0, "page must be greater than 0"
+        assert page_size > 0, "page_size must be greater than 0"
+
+        start_index, end_index = index_range(page, page_size)
+        return self.dataset().rows(start_index, end_index)
+
+    def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict[str, any]:
+        """
+        Retrieve a page of the dataset with hypermedia metadata.
+
+        Args:
+            page (int): The page number (1-indexed, default 1).
+            page_size (int): The number of items per page (default 10).
+
+        Returns:
+            Dict[str, any]: A dictionary containing page_size, page, data,
+                            next_page, prev_page, and total_pages.
+
+        Raises:
+            AssertionError: If page or page_size is not a positive integer.
+        """
+        data = self.get_page(page, page_size)
+        dataset_size = len(self.dataset())
+        total_pages = math.ceil(dataset_size / page_size)
+        has_next = page * page_size < dataset_size
+
+        return {
+            'page_size': len(data),
+            'page': page,
+            'data': data,
+            'next_page': page + 1 if has_next else None,
+            'prev_page': page - 1 if page > 1 else None,
+            'total_pages': total_pages
+        }
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Module for memory-mapped pagination of a baby names dataset.
+
+This module provides a RowIndex of byte offsets for every row of
+Popular_Baby_Names.csv, persisted in a sidecar file, and a Server class
+that memory-maps the CSV and only parses the rows of the requested page.
+Rows must not contain quoted newlines, which holds for this dataset.
+"""
+
+import csv
+import math
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from typing import Dict, List, Tuple
+
+
+def index_range(page: int, page_size: int) -> Tuple[int, int]:
+    """
+    Calculate the start and end indices for a given page and page size.
+
+    Args:
+        page (int): The page number (1-indexed).
+        page_size (int): The number of items per page.
+
+    Returns:
+        Tuple[int, int]: A tuple containing the start index and end index
+                         for the specified page.
+    """
+    start_index = (page - 1) * page_size
+    end_index = start_index + page_size
+    return (start_index, end_index)
+
+
+class RowIndex:
+    """
+    Byte offsets of the start of every line in a CSV file.
+
+    The offsets are saved next to the file in a "<file>.idx" sidecar,
+    stamped with the size and modification time of the CSV, and later
+    opened by mapping that sidecar instead of scanning the CSV again.
+    """
+    MAGIC = b"ROWIDX1\0"
+    HEADER = struct.Struct("<8sQQQ")  # magic, size, mtime_ns, offsets
+
+    def __init__(self, path: str):
+        self.path = path
+        self.sidecar = path + ".idx"
+        stat = os.stat(path)
+        self.__stamp = (stat.st_size, stat.st_mtime_ns)
+        self.__mmap = None
+        self.offsets = self.__load()
+        if self.offsets is None:
+            self.offsets = self.__build()
+            self.__save()
+
+    def __load(self):
+        """
+        Map the sidecar if it matches the current CSV file.
+
+        Returns:
+            memoryview or None: The offsets, or None if the sidecar is
+                                missing or stale.
+        """
+        try:
+            with open(self.sidecar, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(mapped) < self.HEADER.size:
+            mapped.close()
+            return None
+        magic, size, mtime_ns, count = self.HEADER.unpack_from(mapped)
+        if (magic != self.MAGIC or (size, mtime_ns) != self.__stamp or
+                len(mapped) != self.HEADER.size + count * 8):
+            mapped.close()
+            return None
+        self.__mmap = mapped
+        return memoryview(mapped)[self.HEADER.size:].cast("Q")
+
+    def __build(self) -> array:
+        """
+        Scan the CSV file for line starts.
+
+        Returns:
+            array: The offset of every line, followed by the file size.
+        """
+        offsets = array("Q", [0])
+        size = self.__stamp[0]
+        with open(self.path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            with data:
+                position = data.find(b"\n")
+                while position != -1 and position + 1 < size:
+                    offsets.append(position + 1)
+                    position = data.find(b"\n", position + 1)
+        offsets.append(size)
+        return offsets
+
+    def __save(self) -> None:
+        """Write the sidecar atomically; a read-only directory is not fatal."""
+        header = self.HEADER.pack(self.MAGIC, self.__stamp[0],
+                                  self.__stamp[1], len(self.offsets))
+        # A temporary file of its own, as several processes may save at once
+        try:
+            descriptor, temporary = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.sidecar)),
+                prefix=os.path.basename(self.sidecar) + ".", suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "wb") as f:
+                    f.write(header)
+                    f.write(self.offsets.tobytes())
+                os.replace(temporary, self.sidecar)
+            except OSError:
+                os.unlink(temporary)
+                raise
+        except OSError:
+            pass
+
+    def __len__(self) -> int:
+        """Number of lines in the file."""
+        return len(self.offsets) - 1
+
+
+class Server:
+    """Server class to paginate a database of popular baby names."""
+    DATA_FILE = "Popular_Baby_Names.csv"
+
+    def __init__(self):
+        self.__index = None
+        self.__data = None
+
+    def index(self) -> RowIndex:
+        """
+        Open the row index and map the CSV file, once.
+
+        Returns:
+            RowIndex: The line offsets of the CSV file.
+        """
+        if self.__index is None:
+            self.__index = RowIndex(self.DATA_FILE)
+            with open(self.DATA_FILE, "rb") as f:
+                self.__data = mmap.mmap(f.fileno(), 0,
+                                        access=mmap.ACCESS_READ)
+        return self.__index
+
+    def size(self) -> int:
+        """
+        Number of rows in the dataset, excluding the header.
+
+        Returns:
+            int: The row count.
+        """
+        return max(0, len(self.index()) - 1)
+
+    def rows(self, start: int, end: int) -> List[List]:
+        """
+        Parse only the rows in [start, end) from the mapped file.
+
+        Args:
+            start (int): The first row index (0-based, header excluded).
+            end (int): The index after the last row.
+
+        Returns:
+            List[List]: The rows, clipped to the dataset.
+        """
+        end = min(end, self.size())
+        if start >= end:
+            return []
+        offsets = self.index().offsets
+        # Line 0 is the header, so row i is line i + 1
+        chunk = self.__data[offsets[start + 1]:offsets[end + 1]]
+        return list(csv.reader(chunk.decode().splitlines()))
+
+    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
+        """
+        Retrieve a specific page of the dataset.
+
+        Args:
+            page (int): The page number (1-indexed, default 1).
+            page_size (int): The number of items per page (default 10).
+
+        Returns:
+            List[List]: The list of rows for the specified page, or an empty
+                        list if the page is out of range.
+
+        Raises:
+            AssertionError: If page or page_size is not a positive integer.
+        """
+        assert isinstance(page, int), "page must be an integer"
+        assert isinstance(page_size, int), "page_size must be an integer"
+        assert page > 0, "page must be greater than 0"
+        assert page_size > 0, "page_size must be greater than 0"
+
+        start_index, end_index = index_range(page, page_size)
+        return self.rows(start_index, end_index)
+
+    def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict[str, any]:
+        """
+        Retrieve a page of the dataset with hypermedia metadata.
+
+        Args:
+            page (int): The page number (1-indexed, default 1).
+            page_size (int): The number of items per page (default 10).
+
+        Returns:
+            Dict[str, any]: A dictionary containing page_size, page, data,
+                            next_page, prev_page, and total_pages.
+
+        Raises:
+            AssertionError: If page or page_size is not a positive integer.
+        """
+        data = self.get_page(page, page_size)
+        dataset_size = self.size()
+        total_pages = math.ceil(dataset_size / page_size)
+        has_next = page * page_size < dataset_size
+
+        return {
+            'page_size': len(data),
+            'page': page,
+            'data': data,
+            'next_page': page + 1 if has_next else None,
+            'prev_page': page - 1 if page > 1 else None,
+            'total_pages': total_pages
+        }
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Module for asyncio pagination of a baby names dataset.
+
+This module provides an AsyncServer with coroutine versions of
+get_page, get_hyper and get_hyper_index. The CSV file is parsed once,
+in an executor, and every request arriving during that parse awaits
+the same load instead of starting its own.
+"""
+
+import asyncio
+import csv
+import math
+import threading
+from typing import Dict, List, Tuple
+
+LiveIndex = __import__('3-hypermedia_del_pagination').LiveIndex
+
+
+def index_range(page: int, page_size: int) -> Tuple[int, int]:
+    """
+    Calculate the start and end indices for a given page and page size.
+
+    Args:
+        page (int): The page number (1-indexed).
+        page_size (int): The number of items per page.
+
+    Returns:
+        Tuple[int, int]: A tuple containing the start index and end index
+                         for the specified page.
+    """
+    start_index = (page - 1) * page_size
+    end_index = start_index + page_size
+    return (start_index, end_index)
+
+
+class AsyncServer:
+    """Asyncio server class to paginate a database of popular baby names."""
+    DATA_FILE = "Popular_Baby_Names.csv"
+
+    def __init__(self):
+        self.__dataset = None
+        self.__live = None
+        self.__loading = None
+        self.__lock = threading.Lock()
+        self.loads = 0
+
+    def __load(self) -> List[List]:
+        """
+        Parse the CSV file, at most once even across threads.
+
+        Returns:
+            List[List]: The dataset as a list of rows, excluding the header.
+        """
+        with self.__lock:
+            if self.__dataset is None:
+                with open(self.DATA_FILE) as f:
+                    reader = csv.reader(f)
+                    next(reader, None)
+                    dataset = [row for row in reader]
+                self.__live = LiveIndex(len(dataset))
+                self.__dataset = dataset
+                self.loads += 1
+        return self.__dataset
+
+    async def dataset(self) -> List[List]:
+        """
+        Retrieve the dataset, loading it in an executor on first use.
+
+        Concurrent callers share one pending load.
+
+        Returns:
+            List[List]: The dataset as a list of rows, excluding the header.
+        """
+        if self.__dataset is not None:
+            return self.__dataset
+        if self.__loading is None:
+            loop = asyncio.get_running_loop()
+            self.__loading = loop.run_in_executor(None, self.__load)
+        try:
+            # Shielded so one cancelled request doesn't cancel the others
+            return await asyncio.shield(self.__loading)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Let the next request retry a failed load
+            self.__loading = None
+            raise
+
+    async def get_page(self, page: int = 1,
+                       page_size: int = 10) -> List[List]:
+        """
+        Retrieve a specific page of the dataset.
+
+        Args:
+            page (int): The page number (1-indexed, default 1).
+            page_size (int): The number of items per page (default 10).
+
+        Returns:
+            List[List]: The list of rows for the specified page, or an empty
+                        list if the page is out of range.
+
+        Raises:
+            AssertionError: If page or page_size is not a positive integer.
+        """
+        assert isinstance(page, int), "page must be an integer"
+        assert isinstance(page_size, int), "page_size must be an integer"
+        assert page > 0, "page must be greater than 0"
+        assert page_size > 0, "page_size must be greater than 0"
+
+        start_index, end_index = index_range(page, page_size)
+        dataset = await self.dataset()
+
+        if start_index >= len(dataset):
+            return []
+        return dataset[start_index:end_index]
+
+    async def get_hyper(self, page: int = 1,
+                        page_size: int = 10) -> Dict[str, any]:
+        """
+        Retrieve a page of the dataset with hypermedia metadata.
+
+        Args:
+            page (int): The page number (1-indexed, default 1).
+            page_size (int): The number of items per page (default 10).
+
+        Returns:
+            Dict[str, any]: A dictionary containing page_size, page, data,
+                            next_page, prev_page, and total_pages.
+
+        Raises:
+            AssertionError: If page or page_size is not a positive integer.
+        """
+        data = await self.get_page(page, page_size)
+        dataset_size = len(await self.dataset())
+        total_pages = math.ceil(dataset_size / page_size)
+        has_next = page * page_size < dataset_size
+
+        return {
+            'page_size': len(data),
+            'page': page,
+            'data': data,
+            'next_page': page + 1 if has_next else None,
+            'prev_page': page - 1 if page > 1 else None,
+            'total_pages': total_pages
+        }
+
+    async def delete(self, index: int) -> None:
+        """
+        Delete the row at an index; other rows keep their indices.
+
+        Args:
+            index (int): The index of a live row.
+
+        Raises:
+            AssertionError: If index is not a live row.
+        """
+        await self.dataset()
+        assert index in self.__live, "index must be a live row"
+        self.__live.delete(index)
+
+    async def get_hyper_index(self, index: int = None,
+                              page_size: int = 10) -> Dict:
+        """
+        Retrieve a page of the dataset starting at the specified index.
+
+        Args:
+            index (int, optional): The starting index (0-based, default None).
+                                   If None, starts at 0.
+            page_size (int): The number of items per page (default 10).
+
+        Returns:
+            Dict: A dictionary containing:
+                - index: Current start index.
+                - next_index: Index of the first item after the current page.
+                - page_size: Number of items in the current page.
+                - data: List of rows for the current page.
+
+        Raises:
+            AssertionError: If index is negative or out of range.
+        """
+        assert isinstance(index, (int, type(None))), \
+            "index must be an integer or None"
+        assert isinstance(page_size, int), "page_size must be an integer"
+        assert page_size > 0, "page_size must be greater than 0"
+
+        # Default to index 0 if None
+        index = 0 if index is None else index
+        assert index >= 0, "index must be non-negative"
+
+        dataset = await self.dataset()
+        max_index = len(self.__live)
+        assert index < max_index, "index out of range"
+
+        indices = self.__live.following(index, page_size)
+        data = [dataset[i] for i in indices]
+
+        # Set next_index to the index after the last row of the page
+        next_index = None
+        if len(indices) == page_size and indices[-1] + 1 < max_index:
+            next_index = indices[-1] + 1
+
+        return {
+            'index': index,
+            'next_index': next_index,
+            'page_size': len(data),
+            'data': data
+        }
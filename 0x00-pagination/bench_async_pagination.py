@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Asyncio load benchmark for the async pagination server.
+
+Starts N clients at once against a cold server, each requesting a few
+random hyper pages, and compares:
+    - sync: the 2-hypermedia_pagination Server called from the default
+      executor, where each thread that sees an empty cache parses the CSV
+    - async: AsyncServer, where every client awaits one shared load
+
+It reports how many times the CSV was parsed, the time until every
+client got its first page, and latency percentiles over all requests.
+
+Usage:
+    ./bench_async_pagination.py [clients] [requests_per_client]
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+SyncServer = __import__('2-hypermedia_pagination').Server
+AsyncServer = __import__('6-async_pagination').AsyncServer
+
+PAGE_SIZE = 10
+ROWS = 19418  # Rows of Popular_Baby_Names.csv
+
+
+class CountingServer(SyncServer):
+    """Sync server counting the CSV parses its threads start."""
+
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+    def dataset(self):
+        """Count each parse of a cold cache, then delegate."""
+        if self._Server__dataset is None:
+            self.loads += 1
+        return super().dataset()
+
+
+async def client(fetch, pages, requests, latencies, first):
+    """
+    Fetch random pages and record each latency.
+
+    Args:
+        fetch: Coroutine function taking a page number.
+        pages (int): The number of pages to pick from.
+        requests (int): The number of pages to fetch.
+        latencies (list): Receives every latency, in seconds.
+        first (list): Receives the completion time of the first page.
+    """
+    for i in range(requests):
+        start = time.perf_counter()
+        await fetch(random.randint(1, pages))
+        end = time.perf_counter()
+        latencies.append(end - start)
+        if i == 0:
+            first.append(end)
+
+
+async def run(make_fetch, clients, requests):
+    """
+    Run every client at once against a cold server.
+
+    Returns:
+        tuple: (loads, seconds until all first pages, latencies)
+    """
+    server, fetch = make_fetch()
+    latencies, first = [], []
+    pages = ROWS // PAGE_SIZE
+    start = time.perf_counter()
+    await asyncio.gather(*(client(fetch, pages, requests, latencies, first)
+                           for _ in range(clients)))
+    return server.loads, max(first) - start, sorted(latencies)
+
+
+def make_sync():
+    """Cold sync server, called through the default executor."""
+    server = CountingServer()
+    loop = asyncio.get_running_loop()
+
+    def fetch(page):
+        return loop.run_in_executor(None, server.get_hyper, page, PAGE_SIZE)
+    return server, fetch
+
+
+def make_async():
+    """Cold async server."""
+    server = AsyncServer()
+
+    def fetch(page):
+        return server.get_hyper(page, PAGE_SIZE)
+    return server, fetch
+
+
+def percentile(values, fraction):
+    """Value at a fraction of a sorted list."""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    """Print one line per server."""
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print(f"{clients} clients x {requests} requests, page_size {PAGE_SIZE}")
+    print(f"{'server':<8}{'loads':>6}{'first page':>12}"
+          f"{'p50':>10}{'p99':>10}")
+    for name, make_fetch in (("sync", make_sync), ("async", make_async)):
+        loads, ready, latencies = asyncio.run(
+            run(make_fetch, clients, requests))
+        print(f"{name:<8}{loads:>6}{ready * 1000:>10.1f}ms"
+              f"{percentile(latencies, 0.5) * 1000:>8.2f}ms"
+              f"{percentile(latencies, 0.99) * 1000:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
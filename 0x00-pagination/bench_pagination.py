@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Benchmark and regression suite for the pagination servers.
+
+Measures, for every Server module of this project:
+    - cold: a fresh Server serving its first page (sidecar files such
+      as the row index or the snapshot already written)
+    - shallow / deep: warm get_page, get_hyper and get_hyper_index
+      latency, whichever the server has, on the first page and on the
+      last full page of the dataset
+and, for 3-hypermedia_del_pagination:
+    - get_hyper_index after deleting half of the rows at random, and
+      across a gap of one contiguous tenth of deleted rows
+plus index_range itself.
+
+Every metric is the median of several runs, in seconds. Results are
+printed and can be saved as JSON; a saved file can then be compared to
+a new run, which exits with status 1 when a metric got slower than the
+threshold allows.
+
+By default the bundled Popular_Baby_Names.csv is used. --rows generates
+a synthetic CSV of the same shape instead (kept in --data-dir for later
+runs). The list based servers hold every row as Python strings, so at
+10M rows restrict them with --servers to the ones that fit in memory.
+
+Usage:
+    ./bench_pagination.py [--rows N] [--servers 1,2,3,4,5]
+                          [--output results.json]
+                          [--compare baseline.json] [--threshold 0.2]
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+SERVERS = {
+    "1": "1-simple_pagination",
+    "2": "2-hypermedia_pagination",
+    "3": "3-hypermedia_del_pagination",
+    "4": "4-columnar_pagination",
+    "5": "5-mmap_pagination",
+}
+HEADER = ["Year of Birth", "Gender", "Ethnicity", "Child's First Name",
+          "Count", "Rank"]
+ETHNICITIES = ["ASIAN AND PACIFIC ISLANDER", "BLACK NON HISPANIC",
+               "HISPANIC", "WHITE NON HISPANIC"]
+PAGE_SIZE = 10
+NUMBER = 20  # Calls per measurement of warm metrics
+
+
+def synthetic_csv(rows: int, directory: str) -> str:
+    """
+    Write, once, a CSV file shaped like Popular_Baby_Names.csv.
+
+    Args:
+        rows (int): The number of rows, excluding the header.
+        directory (str): Where to keep the file.
+
+    Returns:
+        str: The path of the file.
+    """
+    path = os.path.join(directory, "baby_names_{}.csv".format(rows))
+    if os.path.exists(path):
+        return path
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(rows)
+    names = ["Name{}".format(i) for i in range(5000)]
+    temporary = path + ".tmp"
+    with open(temporary, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for i in range(rows):
+            writer.writerow([2011 + i % 6, rng.choice(("FEMALE", "MALE")),
+                             rng.choice(ETHNICITIES), rng.choice(names),
+                             rng.randint(10, 300), i % 100 + 1])
+    os.replace(temporary, path)
+    return path
+
+
+def median_time(function, repeats: int, number: int = 1) -> float:
+    """
+    Median duration of a call.
+
+    Args:
+        function: Function called without arguments.
+        repeats (int): The number of measurements.
+        number (int): Calls per measurement, so that fast calls are not
+                      lost in the timer resolution.
+
+    Returns:
+        float: The median time of one call, in seconds.
+    """
+    times = []
+    calls = range(number)
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in calls:
+            function()
+        times.append((time.perf_counter() - start) / number)
+    return statistics.median(times)
+
+
+def server_class(module: str, data_file: str):
+    """The Server class of a module, reading data_file."""
+    base = __import__(module).Server
+    return type("Server", (base,), {"DATA_FILE": data_file})
+
+
+def bench_index_range(results: dict, repeats: int) -> None:
+    """Time index_range over increasing pages."""
+    index_range = __import__('0-simple_helper_function').index_range
+
+    page = iter(range(1, repeats * 1000 + 1))
+    results["index_range"] = median_time(
+        lambda: index_range(next(page), PAGE_SIZE), repeats, 1000)
+
+
+def bench_server(results: dict, key: str, module: str, data_file: str,
+                 repeats: int) -> None:
+    """Time cold start and warm shallow and deep pages of one server."""
+    cls = server_class(module, data_file)
+    if hasattr(cls, "get_page"):
+        def first(server):
+            return server.get_page(1, PAGE_SIZE)
+    else:
+        def first(server):
+            return server.get_hyper_index(0, PAGE_SIZE)
+    first(cls())  # Write sidecars, warm the page cache
+    results["{}.cold".format(key)] = median_time(
+        lambda: first(cls()), max(1, repeats // 10))
+
+    server = cls()
+    first(server)
+    size = server.size() if hasattr(server, "size") \
+        else len(server.dataset())
+    pages = (("shallow", 1), ("deep", max(1, size // PAGE_SIZE)))
+    for method in ("get_page", "get_hyper"):
+        if hasattr(server, method):
+            for depth, page in pages:
+                results["{}.{}.{}".format(key, method, depth)] = \
+                    median_time(lambda: getattr(server, method)(
+                        page, PAGE_SIZE), repeats, NUMBER)
+    if hasattr(server, "get_hyper_index"):
+        for depth, index in (("shallow", 0), ("deep", size - PAGE_SIZE)):
+            results["{}.get_hyper_index.{}".format(key, depth)] = \
+                median_time(lambda: server.get_hyper_index(
+                    index, PAGE_SIZE), repeats, NUMBER)
+
+
+def bench_deletions(results: dict, data_file: str, repeats: int) -> None:
+    """Time get_hyper_index over randomly deleted rows and across a gap."""
+    cls = server_class(SERVERS["3"], data_file)
+    rng = random.Random(0)
+
+    server = cls()
+    size = len(server.dataset())
+    for index in rng.sample(range(size), size // 2):
+        server.delete(index)
+    position = iter([rng.randrange(size - PAGE_SIZE * 4)
+                     for _ in range(repeats * NUMBER)])
+    results["3.get_hyper_index.half_deleted"] = median_time(
+        lambda: server.get_hyper_index(next(position), PAGE_SIZE),
+        repeats, NUMBER)
+
+    server = cls()
+    server.dataset()
+    gap = size // 10
+    for index in range(gap, 2 * gap):
+        server.delete(index)
+    results["3.get_hyper_index.across_gap"] = median_time(
+        lambda: server.get_hyper_index(gap, PAGE_SIZE), repeats, NUMBER)
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """
+    Print each metric next to its baseline.
+
+    Args:
+        results (dict): The new metrics.
+        baseline (dict): The saved metrics.
+        threshold (float): Allowed slowdown, 0.2 meaning 20%.
+
+    Returns:
+        bool: True if no metric regressed beyond the threshold.
+    """
+    ok = True
+    print("\n{:<40}{:>12}{:>12}{:>9}".format(
+        "metric", "baseline", "now", "change"))
+    for name, now in sorted(results.items()):
+        before = baseline.get(name)
+        if not before:
+            print("{:<40}{:>12}{:>10.1f}us{:>9}".format(
+                name, "-", now * 1e6, "new"))
+            continue
+        change = now / before - 1
+        flag = ""
+        if change > threshold:
+            flag, ok = "  REGRESSION", False
+        print("{:<40}{:>10.1f}us{:>10.1f}us{:>+8.0%}{}".format(
+            name, before * 1e6, now * 1e6, change, flag))
+    return ok
+
+
+def main():
+    """Run the suite, then save and compare the results as asked."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int,
+                        help="synthetic rows instead of the bundled CSV")
+    parser.add_argument("--data-dir", default=os.path.join(
+        tempfile.gettempdir(), "pagination-bench"))
+    parser.add_argument("--servers", default=",".join(SERVERS))
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--output", help="save the results as JSON")
+    parser.add_argument("--compare", help="JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    data_file = "Popular_Baby_Names.csv"
+    if args.rows:
+        data_file = synthetic_csv(args.rows, args.data_dir)
+    keys = [key for key in args.servers.split(",") if key]
+
+    results = {}
+    bench_index_range(results, args.repeats)
+    for key in keys:
+        bench_server(results, key, SERVERS[key], data_file, args.repeats)
+    if "3" in keys:
+        bench_deletions(results, data_file, args.repeats)
+
+    for name, seconds in sorted(results.items()):
+        print("{:<40}{:>10.1f}us".format(name, seconds * 1e6))
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "data_file": os.path.basename(data_file),
+            "rows": args.rows,
+            "repeats": args.repeats,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("data_file") != \
+                report["meta"]["data_file"]:
+            print("warning: baseline used another dataset", file=sys.stderr)
+        if not compare(results, baseline["results"], args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
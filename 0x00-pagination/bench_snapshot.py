@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the columnar dataset snapshot.
+
+Times what a fresh worker pays before it can serve its first page:
+    - csv rows: the csv module into a list of rows (1-simple_pagination)
+    - csv columns: the csv module into a ColumnarDataset
+    - snapshot: mapping the binary snapshot written after the first parse
+Each is run several times and the median is reported.
+
+Usage:
+    ./bench_snapshot.py [repeats]
+"""
+
+import csv
+import statistics
+import sys
+import time
+
+columnar = __import__('4-columnar_pagination')
+ColumnarDataset = columnar.ColumnarDataset
+DATA_FILE = columnar.Server.DATA_FILE
+SNAPSHOT = DATA_FILE + ".snap"
+
+
+def csv_rows():
+    """Parse the CSV file into lists of strings."""
+    with open(DATA_FILE) as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        return [row for row in reader]
+
+
+def csv_columns():
+    """Parse the CSV file into columns."""
+    return ColumnarDataset.from_csv(DATA_FILE)
+
+
+def snapshot():
+    """Map the snapshot."""
+    dataset = ColumnarDataset.load(SNAPSHOT, DATA_FILE)
+    assert dataset is not None, "snapshot is stale"
+    return dataset
+
+
+def main():
+    """Print the median load time of each method."""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    csv_columns().save(SNAPSHOT, DATA_FILE)
+    baseline = None
+    print(f"{'method':<12}{'median':>10}{'speedup':>10}")
+    for name, load in (("csv rows", csv_rows),
+                       ("csv columns", csv_columns),
+                       ("snapshot", snapshot)):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            load()
+            times.append(time.perf_counter() - start)
+        median = statistics.median(times)
+        baseline = baseline or median
+        print(f"{name:<12}{median * 1000:>8.2f}ms{baseline / median:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,47 +2,46 @@
 """ FIFO caching module
 """
 
-from base_caching import BaseCaching
+from collections import OrderedDict
+from base_policy import BasePolicy
 
 
-class FIFOCache(BaseCaching):
+class FIFOCache(BasePolicy):
     """ FIFOCache defines a FIFO caching system that:
-        - Inherits from BaseCaching
+        - Inherits from BasePolicy (itself a BaseCaching)
         - Stores items in a dictionary with a maximum limit
         - Discards the first item added when the cache is full
     """
 
-    def __init__(self):
+    def __init__(self, **options):
         """ Initialize the FIFO cache
+            Args:
+                options: TTL and weight options, see BasePolicy
         """
-        super().__init__()
-        self.order = []  # Tracks insertion order for FIFO
+        super().__init__(**options)
+        self.order = OrderedDict()  # Tracks insertion order for FIFO
 
-    def put(self, key, item):
-        """ Add an item to the cache using FIFO strategy
+    def _on_insert(self, key):
+        """ Queue a new key behind the others
             Args:
-                key: The key for the item
-                item: The item to be stored
+                key: The key that was added
         """
-        if key is None or item is None:
-            return
+        self.order[key] = None
 
-        # Add or update the item in cache
-        if key not in self.cache_data:
-            if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-                # Remove the first item added (FIFO)
-                first_key = self.order.pop(0)
-                print(f"DISCARD: {first_key}")
-                del self.cache_data[first_key]
-            self.order.append(key)
-        
-        self.cache_data[key] = item
+    def _on_remove(self, key):
+        """ Drop a key from the insertion order
+            Args:
+                key: The key that was removed
+        """
+        del self.order[key]
 
-    def get(self, key):
-        """ Retrieve an item from the cache by key
+    def _victim(self, exclude=None):
+        """ Choose the first item added (FIFO)
             Args:
-                key: The key of the item to retrieve
+                exclude: A key that must not be chosen
             Returns:
-                The item associated with the key, or None if key doesn't exist
+                The oldest key
         """
-        return self.cache_data.get(key)
+        for key in self.order:
+            if key != exclude:
+                return key
@@ -2,67 +2,83 @@
 """ LFU caching module
 """
 
-from base_caching import BaseCaching
+from collections import OrderedDict
+from base_policy import BasePolicy
 
 
-class LFUCache(BaseCaching):
+class LFUCache(BasePolicy):
     """ LFUCache defines a Least Frequently Used caching system that:
-        - Inherits from BaseCaching
+        - Inherits from BasePolicy (itself a BaseCaching)
         - Stores items in a dictionary with a maximum limit
         - Discards the least frequently used item when the cache is full
         - Uses LRU algorithm to break ties in frequency
+        - Groups keys into per-frequency buckets so every operation is O(1)
     """
 
-    def __init__(self):
+    def __init__(self, **options):
         """ Initialize the LFU cache
+            Args:
+                options: TTL and weight options, see BasePolicy
         """
-        super().__init__()
+        super().__init__(**options)
         self.freq = {}  # Tracks frequency of each key
-        self.lru_order = []  # Tracks recency order for LRU tiebreaker
+        self.buckets = {}  # Frequency -> keys in LRU order (oldest first)
+        self.min_freq = 0  # Lowest frequency currently in the cache
 
-    def put(self, key, item):
-        """ Add an item to the cache using LFU strategy
+    def _on_insert(self, key):
+        """ Start a new key in the frequency 1 bucket
             Args:
-                key: The key for the item
-                item: The item to be stored
+                key: The key that was added
         """
-        if key is None or item is None:
-            return
+        self.freq[key] = 1
+        self.buckets.setdefault(1, OrderedDict())[key] = None
+        self.min_freq = 1
 
-        # If key exists, update it
-        if key in self.cache_data:
-            self.lru_order.remove(key)
-        else:
-            # If cache will exceed MAX_ITEMS, remove least frequently used item
-            if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-                # Find minimum frequency
-                min_freq = min(self.freq.values())
-                # Get keys with minimum frequency
-                lfu_keys = [k for k in self.lru_order if self.freq[k] == min_freq]
-                # Remove the least recently used among them (first in lru_order)
-                lfu_key = lfu_keys[0]
-                self.lru_order.remove(lfu_key)
-                print(f"DISCARD: {lfu_key}")
-                del self.cache_data[lfu_key]
-                del self.freq[lfu_key]
+    def _on_access(self, key):
+        """ Move a key from its frequency bucket to the next one
+            Args:
+                key: The key that has just been used
+        """
+        freq = self.freq[key]
+        self._unlink(key, freq)
+        self.freq[key] = freq + 1
+        self.buckets.setdefault(freq + 1, OrderedDict())[key] = None
 
-        # Add or update the item in cache
-        self.cache_data[key] = item
-        self.lru_order.append(key)
-        # Update frequency (increment for existing key, initialize for new)
-        self.freq[key] = self.freq.get(key, 0) + 1
+    _on_update = _on_access
+
+    def _on_remove(self, key):
+        """ Drop a key and its frequency
+            Args:
+                key: The key that was removed
+        """
+        self._unlink(key, self.freq.pop(key))
+
+    def _unlink(self, key, freq):
+        """ Take a key out of its bucket, dropping the bucket if empty
+            Args:
+                key: The key to take out
+                freq: The current frequency of the key
+        """
+        bucket = self.buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[freq]
+            if self.min_freq == freq:
+                # A lower bound after removals; _victim rescans if needed
+                self.min_freq = freq + 1
 
-    def get(self, key):
-        """ Retrieve an item from the cache by key
+    def _victim(self, exclude=None):
+        """ Choose the least recently used key of the lowest frequency
             Args:
-                key: The key of the item to retrieve
+                exclude: A key that must not be chosen
             Returns:
-                The item associated with the key, or None if key doesn't exist
+                The key to discard
         """
-        if key is None or key not in self.cache_data:
-            return None
-        # Update frequency and LRU order
-        self.freq[key] += 1
-        self.lru_order.remove(key)
-        self.lru_order.append(key)
-        return self.cache_data[key]
+        if self.min_freq not in self.buckets:
+            self.min_freq = min(self.buckets)
+        for key in self.buckets[self.min_freq]:
+            if key != exclude:
+                return key
+        # exclude is alone in the lowest bucket, use the next one
+        freq = min(f for f in self.buckets if f != self.min_freq)
+        return next(iter(self.buckets[freq]))
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+""" Sharded, thread-safe caching module
+"""
+
+from base_caching import BaseCaching
+from cache_stats import Histogram, to_prometheus
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class ShardedCache(BaseCaching):
+    """ ShardedCache defines a thread-safe caching system that:
+        - Inherits from BaseCaching
+        - Spreads keys over N shards by hash, each shard being an
+          instance of the chosen eviction policy (LRU by default)
+        - Relies on the lock of each shard, so threads working on
+          different shards never wait for each other
+        - Splits MAX_ITEMS (or max_weight) between the shards, so that
+          their capacities differ by at most one and add up to exactly
+          the total, with at most one shard per unit of capacity;
+          eviction is decided per shard rather than over the whole cache
+    """
+
+    def __init__(self, policy=LRUCache, shards=8, **options):
+        """ Initialize the sharded cache
+            Args:
+                policy: The BasePolicy subclass used for every shard
+                shards: The number of independently locked shards,
+                        lowered to the capacity if it is smaller
+                options: Keyword arguments passed to every shard
+        """
+        # cache_data is a read-only view over the shards, so
+        # BaseCaching.__init__ is not called
+        if shards < 1:
+            raise ValueError("shards must be greater than 0")
+        max_weight = options.get('max_weight')
+        capacity = self.MAX_ITEMS if max_weight is None else max_weight
+        shards = max(1, min(shards, capacity))
+        # The first `extra` shards hold one more unit than the others
+        per_shard, extra = divmod(capacity, shards)
+        self.shards = []
+        for index in range(shards):
+            size = per_shard + (1 if index < extra else 0)
+            if max_weight is None:
+                shard = policy(**options)
+                shard.MAX_ITEMS = size
+            else:
+                shard = policy(**dict(options, max_weight=size))
+            self.shards.append(shard)
+
+    @property
+    def cache_data(self):
+        """ Snapshot of every item across all shards
+        """
+        data = {}
+        for shard in self.shards:
+            with shard.lock:
+                data.update(shard.cache_data)
+        return data
+
+    def _index(self, key):
+        """ Compute the shard a key belongs to
+            Args:
+                key: The key to route
+            Returns:
+                The index of the shard holding the key
+        """
+        return hash(key) % len(self.shards)
+
+    def put(self, key, item, ttl=None):
+        """ Add an item to the shard owning the key
+            Args:
+                key: The key for the item
+                item: The item to be stored
+                ttl: Lifetime in seconds, defaults to the shard default_ttl
+        """
+        if key is None or item is None:
+            return
+        self.shards[self._index(key)].put(key, item, ttl)
+
+    def get(self, key):
+        """ Retrieve an item from the shard owning the key
+            Args:
+                key: The key of the item to retrieve
+            Returns:
+                The item associated with the key, or None if key doesn't exist
+        """
+        if key is None:
+            return None
+        return self.shards[self._index(key)].get(key)
+
+    def delete(self, key):
+        """ Remove an item from the shard owning the key, if present
+            Args:
+                key: The key of the item to remove
+            Returns:
+                True if the item was cached
+        """
+        if key is None:
+            return False
+        return self.shards[self._index(key)].delete(key)
+
+    def clear(self):
+        """ Remove every item from every shard, keeping the counters
+        """
+        for shard in self.shards:
+            shard.clear()
+
+    def stats(self):
+        """ Counters summed over every shard
+            Returns:
+                A dict shaped like BasePolicy.stats
+        """
+        shards = [shard.stats() for shard in self.shards]
+        stats = {'policy': shards[0]['policy']}
+        for name in ('items', 'total_weight', 'hits', 'misses', 'inserts',
+                     'updates', 'evictions', 'expirations', 'rejections'):
+            stats[name] = sum(shard[name] for shard in shards)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        for op in ('get', 'put'):
+            if getattr(self.shards[0], op + '_latency') is None:
+                continue
+            merged = Histogram()
+            for shard in self.shards:
+                with shard.lock:
+                    merged.merge(getattr(shard, op + '_latency'))
+            stats[op + '_latency'] = merged.as_dict()
+        return stats
+
+    def stats_prometheus(self, prefix="cache"):
+        """ Summed counters in the Prometheus text exposition format
+            Args:
+                prefix: The metric name prefix
+            Returns:
+                The metrics as a string
+        """
+        return to_prometheus(self.stats(), prefix)
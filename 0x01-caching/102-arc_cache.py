@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+""" ARC caching module
+"""
+
+from collections import OrderedDict
+from base_policy import BasePolicy
+
+
+class ARCCache(BasePolicy):
+    """ ARCCache defines an Adaptive Replacement Cache that:
+        - Inherits from BasePolicy (itself a BaseCaching)
+        - Keeps keys seen once (t1) apart from keys seen again (t2)
+        - Remembers recently discarded keys in ghost lists (b1, b2)
+        - Moves the target size p of t1 towards whichever ghost list
+          gets hits, tuning itself between recency and frequency
+        - Resists scans: a one-off sweep only churns t1, leaving the
+          frequently used keys of t2 in place
+    """
+
+    def __init__(self, **options):
+        """ Initialize the ARC cache
+            Args:
+                options: TTL and weight options, see BasePolicy
+        """
+        super().__init__(**options)
+        self.t1 = OrderedDict()  # Resident keys seen once, LRU first
+        self.t2 = OrderedDict()  # Resident keys seen at least twice
+        self.b1 = OrderedDict()  # Ghosts of keys discarded from t1
+        self.b2 = OrderedDict()  # Ghosts of keys discarded from t2
+        self.p = 0  # Target size of t1
+
+    def _capacity(self):
+        """ Number of resident keys the ghost lists are sized against
+            Returns:
+                MAX_ITEMS, or the current item count in weight mode
+        """
+        if self.max_weight is None:
+            return self.MAX_ITEMS
+        return max(1, len(self.cache_data))
+
+    def _make_room(self, weight, key):
+        """ Adapt p on a ghost hit, then evict until the item fits
+            Args:
+                weight: The weight of the incoming item
+                key: The key being put, which is never evicted
+        """
+        if key not in self.cache_data:
+            if key in self.b1:
+                delta = max(len(self.b2) / len(self.b1), 1)
+                self.p = min(self._capacity(), self.p + delta)
+            elif key in self.b2:
+                delta = max(len(self.b1) / len(self.b2), 1)
+                self.p = max(0, self.p - delta)
+        super()._make_room(weight, key)
+
+    def _on_insert(self, key):
+        """ Add a new key to t1, or to t2 if it was a ghost
+            Args:
+                key: The key that was added
+        """
+        if key in self.b1:
+            del self.b1[key]
+            self.t2[key] = None
+        elif key in self.b2:
+            del self.b2[key]
+            self.t2[key] = None
+        else:
+            self.t1[key] = None
+        self._trim_ghosts()
+
+    def _on_access(self, key):
+        """ Promote a used key to the most recent end of t2
+            Args:
+                key: The key that was used
+        """
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        else:
+            self.t2.move_to_end(key)
+
+    _on_update = _on_access
+
+    def _on_remove(self, key):
+        """ Turn a resident key into a ghost
+            Args:
+                key: The key that was removed
+        """
+        if key in self.t1:
+            del self.t1[key]
+            self.b1[key] = None
+        else:
+            del self.t2[key]
+            self.b2[key] = None
+        self._trim_ghosts()
+
+    def _trim_ghosts(self):
+        """ Keep |t1| + |b1| and the whole directory within bounds
+        """
+        capacity = self._capacity()
+        while self.b1 and len(self.t1) + len(self.b1) > capacity:
+            self.b1.popitem(last=False)
+        while self.b2 and (len(self.t1) + len(self.t2) + len(self.b1) +
+                           len(self.b2) > 2 * capacity):
+            self.b2.popitem(last=False)
+
+    def _victim(self, exclude=None):
+        """ Choose the LRU key of t1 or t2 depending on the target p
+            Args:
+                exclude: A key that must not be chosen; when it is the
+                         key being inserted its ghost status is used
+            Returns:
+                The key to discard
+        """
+        from_t1 = self.t1 and (len(self.t1) > self.p or
+                               (exclude in self.b2 and
+                                len(self.t1) == self.p))
+        lists = (self.t1, self.t2) if from_t1 else (self.t2, self.t1)
+        for keys in lists:
+            for key in keys:
+                if key != exclude:
+                    return key
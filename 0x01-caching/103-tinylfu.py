@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+""" TinyLFU admission module
+"""
+
+# Counter values halved in one bytearray.translate call
+HALVE = bytes(i >> 1 for i in range(256))
+
+
+def _mix(h):
+    """ Scramble a 64-bit hash (splitmix64 finalizer), so that keys with
+        close hashes, such as small ints, get unrelated bits
+        Args:
+            h: The hash to mix
+        Returns:
+            The mixed 64-bit value
+    """
+    h = (h + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return h ^ (h >> 31)
+
+
+def _hashes(key, count, mask):
+    """ Derive several independent slot indexes from one hash, taking
+        consecutive bit fields of the mixed hash and mixing again when
+        its 64 bits run out
+        Args:
+            key: The key to hash
+            count: The number of indexes
+            mask: The table size minus one, a power of two minus one
+        Returns:
+            A list of slot indexes
+    """
+    bits = mask.bit_length()
+    h = hash(key) & 0xFFFFFFFFFFFFFFFF
+    pool = left = 0
+    indexes = []
+    for _ in range(count):
+        if left < bits:
+            h = _mix(h)
+            pool, left = h, 64
+        indexes.append(pool & mask)
+        pool >>= bits
+        left -= bits
+    return indexes
+
+
+class CountMinSketch():
+    """ CountMinSketch defines a compact frequency estimator that:
+        - Keeps depth rows of saturating one-byte counters
+        - Never underestimates, and overestimates only on collisions
+        - Ages by halving every counter
+    """
+
+    MAX_COUNT = 15  # Four bits of information are enough for admission
+
+    def __init__(self, width, depth=4):
+        """ Initialize an empty sketch
+            Args:
+                width: Counters per row, rounded up to a power of two
+                depth: The number of rows
+        """
+        self.width = 1 << max(0, width - 1).bit_length()
+        self.depth = depth
+        self.rows = [bytearray(self.width) for _ in range(depth)]
+
+    def add(self, key):
+        """ Count one occurrence of a key
+            Args:
+                key: The key to count
+        """
+        indexes = _hashes(key, self.depth, self.width - 1)
+        for row, i in zip(self.rows, indexes):
+            if row[i] < self.MAX_COUNT:
+                row[i] += 1
+
+    def estimate(self, key):
+        """ Estimate how often a key was seen
+            Args:
+                key: The key to look up
+            Returns:
+                The smallest of the key's counters
+        """
+        return min(row[i] for row, i in zip(
+            self.rows, _hashes(key, self.depth, self.width - 1)))
+
+    def halve(self):
+        """ Divide every counter by two
+        """
+        for row in self.rows:
+            row[:] = row.translate(HALVE)
+
+
+class Doorkeeper():
+    """ Doorkeeper defines a Bloom filter that:
+        - Absorbs the first occurrence of every key
+        - Keeps one-hit wonders out of the count-min sketch
+    """
+
+    def __init__(self, bits, hashes=3):
+        """ Initialize an empty filter
+            Args:
+                bits: The filter size, rounded up to a power of two
+                hashes: The number of bits set per key
+        """
+        self.size = 1 << max(0, bits - 1).bit_length()
+        self.hashes = hashes
+        self.bits = bytearray(self.size >> 3 or 1)
+
+    def add(self, key):
+        """ Insert a key
+            Args:
+                key: The key to insert
+            Returns:
+                True if the key was probably already present
+        """
+        present = True
+        for i in _hashes(key, self.hashes, self.size - 1):
+            byte, bit = i >> 3, 1 << (i & 7)
+            if not self.bits[byte] & bit:
+                present = False
+                self.bits[byte] |= bit
+        return present
+
+    def __contains__(self, key):
+        """ Check whether a key was probably inserted
+            Args:
+                key: The key to check
+            Returns:
+                False if the key was certainly never inserted
+        """
+        return all(self.bits[i >> 3] & (1 << (i & 7))
+                   for i in _hashes(key, self.hashes, self.size - 1))
+
+    def clear(self):
+        """ Forget every key
+        """
+        self.bits = bytearray(len(self.bits))
+
+
+class TinyLFU():
+    """ TinyLFU defines an admission filter for any BasePolicy that:
+        - Records every lookup in a doorkeeper and a count-min sketch
+        - Admits a new key only if it is estimated to be more frequent
+          than the key the policy would evict for it, so ties (e.g. keys
+          only ever put, never read) keep the victim
+        - Ages the sketch by halving it every sample_size lookups,
+          so formerly hot keys stop blocking new ones
+        - Costs a fixed few bytes per cached item, whatever the number
+          of distinct keys seen
+    """
+
+    def __init__(self, capacity, sample_size=None):
+        """ Initialize the admission filter
+            Args:
+                capacity: The number of items of the guarded cache
+                sample_size: Lookups between two agings, default 10x
+                             the capacity
+        """
+        self.sketch = CountMinSketch(capacity)
+        self.doorkeeper = Doorkeeper(capacity * 8)
+        self.sample_size = sample_size or capacity * 10
+        self.additions = 0
+
+    def record(self, key):
+        """ Count one lookup of a key
+            Args:
+                key: The key that was looked up
+        """
+        if self.doorkeeper.add(key):
+            self.sketch.add(key)
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.sketch.halve()
+            self.doorkeeper.clear()
+            self.additions = 0
+
+    def frequency(self, key):
+        """ Estimate how often a key was looked up recently
+            Args:
+                key: The key to look up
+            Returns:
+                The estimated count
+        """
+        return self.sketch.estimate(key) + (key in self.doorkeeper)
+
+    def admit(self, candidate, victim):
+        """ Decide whether a new key may replace the policy's victim
+            Args:
+                candidate: The key being inserted
+                victim: The key that would be evicted for it
+            Returns:
+                True if the candidate should be cached
+        """
+        return self.frequency(candidate) > self.frequency(victim)
+
+    def memory(self):
+        """ Size of the filter state
+            Returns:
+                The number of bytes used by the sketch and doorkeeper
+        """
+        return (self.sketch.width * self.sketch.depth +
+                len(self.doorkeeper.bits))
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+""" Memoization module
+"""
+
+import asyncio
+import functools
+import threading
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+_KWARGS = object()  # Separates positional from keyword arguments in keys
+
+
+def make_key(*args, **kwargs):
+    """ Default key builder: the call arguments as a hashable tuple
+        Args:
+            args: The positional arguments of the call
+            kwargs: The keyword arguments of the call
+        Returns:
+            A tuple usable as a cache key
+    """
+    if not kwargs:
+        return args
+    return args + (_KWARGS,) + tuple(sorted(kwargs.items()))
+
+
+class _Flight():
+    """ _Flight defines a computation other threads can wait for
+    """
+
+    def __init__(self):
+        """ Initialize a pending computation
+        """
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def memoize(policy=LRUCache, key=make_key, ttl=None, **options):
+    """ Decorator caching the results of a function through a policy
+        Args:
+            policy: The BasePolicy subclass holding the results
+            key: Function building the cache key from the call arguments
+            ttl: Lifetime in seconds of every result, None to keep them
+            options: Keyword arguments passed to the policy
+        Returns:
+            A decorator for plain or async functions. The wrapper has:
+                cache: The policy instance
+                invalidate(*args, **kwargs): drop the result of one call
+                clear(): drop every result
+        Concurrent misses on the same key are computed only once: the
+        first caller runs the function, the others wait for its result.
+        Decorating raises TypeError if the policy has no delete and clear.
+    """
+    def decorator(func):
+        """ Wrap func with a cache """
+        cache = policy(**options)
+        if not (callable(getattr(cache, 'delete', None)) and
+                callable(getattr(cache, 'clear', None))):
+            raise TypeError(f"{policy.__name__} has no delete and clear")
+        flights = {}
+        lock = threading.Lock()
+
+        # Results are boxed in a tuple so None is cacheable too
+        if asyncio.iscoroutinefunction(func):
+            def finish(k, task):
+                """ Cache the result of a finished flight and retire it """
+                del flights[k]
+                # Retrieving the exception also silences the warning
+                # when every caller was cancelled
+                if not task.cancelled() and task.exception() is None:
+                    cache.put(k, (task.result(),), ttl)
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                """ Cached version of func """
+                k = key(*args, **kwargs)
+                boxed = cache.get(k)
+                if boxed is not None:
+                    return boxed[0]
+                # The flight runs in its own task, so a cancelled caller,
+                # the first one included, does not cancel the others
+                task = flights.get(k)
+                if task is None:
+                    task = asyncio.ensure_future(func(*args, **kwargs))
+                    flights[k] = task
+                    task.add_done_callback(functools.partial(finish, k))
+                return await asyncio.shield(task)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                """ Cached version of func """
+                k = key(*args, **kwargs)
+                boxed = cache.get(k)
+                if boxed is not None:
+                    return boxed[0]
+                with lock:
+                    flight = flights.get(k)
+                    if flight is None:
+                        # A leader may have finished since the first lookup
+                        boxed = cache.get(k)
+                        if boxed is not None:
+                            return boxed[0]
+                    leader = flight is None
+                    if leader:
+                        flight = flights[k] = _Flight()
+                if not leader:
+                    flight.done.wait()
+                    if flight.error is not None:
+                        raise flight.error
+                    return flight.result
+                try:
+                    flight.result = func(*args, **kwargs)
+                    cache.put(k, (flight.result,), ttl)
+                    return flight.result
+                except BaseException as error:
+                    flight.error = error
+                    raise
+                finally:
+                    with lock:
+                        del flights[k]
+                    flight.done.set()
+
+        def invalidate(*args, **kwargs):
+            """ Drop the cached result of one call
+                Args:
+                    args: The positional arguments of the call
+                    kwargs: The keyword arguments of the call
+                Returns:
+                    True if a result was cached
+            """
+            return cache.delete(key(*args, **kwargs))
+
+        wrapper.cache = cache
+        wrapper.invalidate = invalidate
+        wrapper.clear = cache.clear
+        return wrapper
+    return decorator
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+""" Redis caching module
+"""
+
+import pickle
+import uuid
+
+from base_caching import BaseCaching
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class RedisCache(BaseCaching):
+    """ RedisCache defines a shared caching system that:
+        - Inherits from BaseCaching
+        - Stores pickled items in Redis, so every worker shares them
+        - Talks to Redis through a connection pool, with MGET and
+          pipelined MSET for batches
+        - Serves repeated reads from a small in-process LRU near-cache,
+          whose copies expire with the Redis keys they came from
+        - Publishes every write on a pub/sub channel, and drops the
+          near-cache copies written by other processes when told to
+        - Keys are stored as strings, under a common prefix
+    """
+
+    def __init__(self, url="redis://localhost:6379/0", prefix="cache:",
+                 channel="cache:invalidate", near_items=128,
+                 max_connections=16, client=None):
+        """ Initialize the cache and start the invalidation listener
+            Args:
+                url: The Redis server URL
+                prefix: The prefix of every Redis key
+                channel: The pub/sub channel used for invalidations
+                near_items: The size of the near-cache, 0 to disable it
+                max_connections: The size of the connection pool
+                client: A ready redis.Redis-compatible client (for
+                        instance an in-memory stand-in), instead of url
+        """
+        # cache_data is a read-only view over Redis, so
+        # BaseCaching.__init__ is not called
+        if client is None:
+            import redis
+            pool = redis.ConnectionPool.from_url(
+                url, max_connections=max_connections)
+            client = redis.Redis(connection_pool=pool)
+        self.client = client
+        self.prefix = prefix
+        self.channel = channel
+        self.origin = uuid.uuid4().hex  # Tells our own messages apart
+        self.near = None
+        self._generation = 0  # Bumped whenever a near-cache copy is dropped
+        self._listener = None
+        if near_items:
+            self.near = LRUCache()
+            self.near.MAX_ITEMS = near_items
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{channel: self._on_invalidate})
+            self._listener = pubsub.run_in_thread(sleep_time=1,
+                                                  daemon=True)
+
+    def _key(self, key):
+        """ Build the Redis key of a cache key
+            Args:
+                key: The cache key
+            Returns:
+                The prefixed key as a string
+        """
+        return f"{self.prefix}{key}"
+
+    @property
+    def cache_data(self):
+        """ Snapshot of every item under the prefix, scanned from Redis
+        """
+        keys = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        values = self.client.mget(keys) if keys else []
+        size = len(self.prefix)
+        return {key.decode()[size:]: pickle.loads(value)
+                for key, value in zip(keys, values) if value is not None}
+
+    def _publish(self, rkeys):
+        """ Tell the other processes to drop their near-cache copies
+            Args:
+                rkeys: The Redis keys that changed
+        """
+        if self.near is not None:
+            for rkey in rkeys:
+                self.client.publish(self.channel, f"{self.origin} {rkey}")
+
+    def _on_invalidate(self, message):
+        """ Drop a near-cache copy changed by another process
+            Args:
+                message: The pub/sub message
+        """
+        data = message['data']
+        if isinstance(data, bytes):
+            data = data.decode()
+        origin, rkey = data.split(" ", 1)
+        if origin != self.origin:
+            self._drop([rkey])
+
+    def _drop(self, rkeys):
+        """ Drop near-cache copies, so that fills read before are skipped
+            Args:
+                rkeys: The Redis keys whose copies are dropped
+        """
+        with self.near.lock:
+            self._generation += 1
+            for rkey in rkeys:
+                self.near.delete(rkey)
+
+    def put(self, key, item, ttl=None):
+        """ Store an item in Redis and in the near-cache
+            Args:
+                key: The key for the item
+                item: The item to be stored
+                ttl: Lifetime in seconds, None to never expire
+        """
+        if key is None or item is None:
+            return
+        self.put_many({key: item}, ttl)
+
+    def get(self, key):
+        """ Retrieve an item from the near-cache or Redis
+            Args:
+                key: The key of the item to retrieve
+            Returns:
+                The item associated with the key, or None if key doesn't exist
+        """
+        if key is None:
+            return None
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items, ttl=None):
+        """ Store several items in one round trip
+            Args:
+                items: A dict of keys to items, None items are skipped
+                ttl: Lifetime in seconds, None to never expire
+        """
+        data = {self._key(key): pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+                for key, item in items.items()
+                if key is not None and item is not None}
+        if not data:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        pipe.mset(data)
+        if ttl is not None:
+            for rkey in data:
+                pipe.pexpire(rkey, int(ttl * 1000))
+        if self.near is not None:
+            for rkey in data:
+                pipe.publish(self.channel, f"{self.origin} {rkey}")
+        pipe.execute()
+        if self.near is not None:
+            with self.near.lock:
+                self._drop(data)
+                for key, item in items.items():
+                    if key is not None and item is not None:
+                        self.near.put(self._key(key), item, ttl)
+
+    def get_many(self, keys):
+        """ Retrieve several items, fetching near-cache misses with MGET
+            Args:
+                keys: The keys of the items to retrieve
+            Returns:
+                A dict of the keys that were found to their items
+        """
+        found = {}
+        missing = []
+        for key in keys:
+            item = None
+            if self.near is not None:
+                item = self.near.get(self._key(key))
+            if item is None:
+                missing.append(key)
+            else:
+                found[key] = item
+        if not missing:
+            return found
+        rkeys = [self._key(key) for key in missing]
+        # Read before the fetch: if a copy is dropped while the values are
+        # on their way, they may be stale and are not kept
+        generation = self._generation
+        if self.near is None:
+            values = self.client.mget(rkeys)
+        else:
+            # The remaining lifetimes come in the same round trip, so
+            # near-cache copies do not outlive their Redis keys
+            pipe = self.client.pipeline(transaction=False)
+            pipe.mget(rkeys)
+            for rkey in rkeys:
+                pipe.pttl(rkey)
+            values, *ttls = pipe.execute()
+        for key, value in zip(missing, values):
+            if value is not None:
+                found[key] = pickle.loads(value)
+        if self.near is None:
+            return found
+        with self.near.lock:
+            if self._generation != generation:
+                return found
+            for key, rkey, ttl in zip(missing, rkeys, ttls):
+                # PTTL is -1 for a key without expiry, -2 if it just expired
+                if key in found and ttl != -2:
+                    self.near.put(rkey, found[key],
+                                  ttl / 1000 if ttl >= 0 else None)
+        return found
+
+    def delete(self, key):
+        """ Remove an item everywhere
+            Args:
+                key: The key of the item to remove
+            Returns:
+                True if the item was in Redis
+        """
+        rkey = self._key(key)
+        removed = self.client.delete(rkey)
+        if self.near is not None:
+            self._drop([rkey])
+        self._publish([rkey])
+        return bool(removed)
+
+    def close(self):
+        """ Stop the invalidation listener and release the connections
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        self.client.close()
@@ -2,50 +2,53 @@
 """ LIFO caching module
 """
 
-from base_caching import BaseCaching
+from collections import OrderedDict
+from base_policy import BasePolicy
 
 
-class LIFOCache(BaseCaching):
+class LIFOCache(BasePolicy):
     """ LIFOCache defines a LIFO caching system that:
-        - Inherits from BaseCaching
+        - Inherits from BasePolicy (itself a BaseCaching)
         - Stores items in a dictionary with a maximum limit
         - Discards the last item added when the cache is full
     """
 
-    def __init__(self):
+    def __init__(self, **options):
         """ Initialize the LIFO cache
+            Args:
+                options: TTL and weight options, see BasePolicy
+        """
+        super().__init__(**options)
+        self.stack = OrderedDict()  # Tracks insertion order for LIFO
+
+    def _on_insert(self, key):
+        """ Push a new key on top of the stack
+            Args:
+                key: The key that was added
         """
-        super().__init__()
-        self.stack = []  # Tracks insertion order for LIFO
+        self.stack[key] = None
 
-    def put(self, key, item):
-        """ Add an item to the cache using LIFO strategy
+    def _on_update(self, key):
+        """ Move an updated key back to the top of the stack
             Args:
-                key: The key for the item
-                item: The item to be stored
+                key: The key that was overwritten
         """
-        if key is None or item is None:
-            return
-
-        # If key already exists, update it and move to top of stack
-        if key in self.cache_data:
-            self.stack.remove(key)
-        else:
-            # If cache will exceed MAX_ITEMS, remove the last item (LIFO)
-            if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-                last_key = self.stack.pop()
-                print(f"DISCARD: {last_key}")
-                del self.cache_data[last_key]
-
-        # Add or update the item in cache
-        self.cache_data[key] = item
-        self.stack.append(key)
-
-    def get(self, key):
-        """ Retrieve an item from the cache by key
+        self.stack.move_to_end(key)
+
+    def _on_remove(self, key):
+        """ Drop a key from the stack
+            Args:
+                key: The key that was removed
+        """
+        del self.stack[key]
+
+    def _victim(self, exclude=None):
+        """ Choose the last item added (LIFO)
             Args:
-                key: The key of the item to retrieve
+                exclude: A key that must not be chosen
             Returns:
-                The item associated with the key, or None if key doesn't exist
+                The key on top of the stack
         """
-        return self.cache_data.get(key)
+        for key in reversed(self.stack):
+            if key != exclude:
+                return key
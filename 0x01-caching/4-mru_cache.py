@@ -2,55 +2,56 @@
 """ MRU caching module
 """
 
-from base_caching import BaseCaching
+from collections import OrderedDict
+from base_policy import BasePolicy
 
 
-class MRUCache(BaseCaching):
+class MRUCache(BasePolicy):
     """ MRUCache defines a Most Recently Used caching system that:
-        - Inherits from BaseCaching
+        - Inherits from BasePolicy (itself a BaseCaching)
         - Stores items in a dictionary with a maximum limit
         - Discards the most recently used item when the cache is full
+        - Keeps usage order in an OrderedDict so every operation is O(1)
     """
 
-    def __init__(self):
+    def __init__(self, **options):
         """ Initialize the MRU cache
+            Args:
+                options: TTL and weight options, see BasePolicy
         """
-        super().__init__()
-        self.mru_order = []  # Tracks usage order for MRU
+        super().__init__(**options)
+        self.mru_order = OrderedDict()  # Tracks usage order for MRU
 
-    def put(self, key, item):
-        """ Add an item to the cache using MRU strategy
+    def _on_insert(self, key):
+        """ Mark a new key as most recently used
             Args:
-                key: The key for the item
-                item: The item to be stored
+                key: The key that was added
         """
-        if key is None or item is None:
-            return
-
-        # If key exists, update it and move to end (most recent)
-        if key in self.cache_data:
-            self.mru_order.remove(key)
-        else:
-            # If cache will exceed MAX_ITEMS, remove most recently used item
-            if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-                mru_key = self.mru_order.pop()
-                print(f"DISCARD: {mru_key}")
-                del self.cache_data[mru_key]
-
-        # Add or update the item in cache
-        self.cache_data[key] = item
-        self.mru_order.append(key)
-
-    def get(self, key):
-        """ Retrieve an item from the cache by key
+        self.mru_order[key] = None
+
+    def _on_access(self, key):
+        """ Move a used key to the end (most recent)
+            Args:
+                key: The key that was used
+        """
+        self.mru_order.move_to_end(key)
+
+    _on_update = _on_access
+
+    def _on_remove(self, key):
+        """ Drop a key from the usage order
+            Args:
+                key: The key that was removed
+        """
+        del self.mru_order[key]
+
+    def _victim(self, exclude=None):
+        """ Choose the most recently used item
             Args:
-                key: The key of the item to retrieve
+                exclude: A key that must not be chosen
             Returns:
-                The item associated with the key, or None if key doesn't exist
+                The key at the end of the usage order
         """
-        if key is None or key not in self.cache_data:
-            return None
-        # Update MRU order: move accessed key to end (most recent)
-        self.mru_order.remove(key)
-        self.mru_order.append(key)
-        return self.cache_data[key]
+        for key in reversed(self.mru_order):
+            if key != exclude:
+                return key
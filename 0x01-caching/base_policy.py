@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+""" Shared eviction policy module
+"""
+
+import pickle
+import random
+import sys
+import threading
+import time
+from base_caching import BaseCaching
+from cache_stats import Histogram, to_prometheus
+
+
+def weigh(item):
+    """ Default weigher: the pickled size of an item in bytes
+        Args:
+            item: The item to weigh
+        Returns:
+            The pickled length, or sys.getsizeof if it can't be pickled
+    """
+    try:
+        return len(pickle.dumps(item, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(item)
+
+
+def print_discard(key, item):
+    """ Eviction listener printing the classic DISCARD line
+        Args:
+            key: The evicted key
+            item: The evicted item
+    """
+    print(f"DISCARD: {key}")
+
+
+class BasePolicy(BaseCaching):
+    """ BasePolicy defines the put/get skeleton shared by every policy:
+        - Inherits from BaseCaching
+        - Handles capacity, eviction and expiry in one place
+        - Lets subclasses describe their policy through small hooks:
+            _on_insert(key): a new key was added
+            _on_update(key): an existing key was overwritten by put
+            _on_access(key): an existing key was read by get
+            _on_remove(key): a key left the cache
+            _victim(exclude): the key to discard when the cache is full,
+                              never exclude
+        - Supports per-item and default TTLs, removing expired items
+          lazily on get and, optionally, from a sampling sweeper thread
+        - Bounds the cache by MAX_ITEMS, or by total item weight when
+          max_weight is set, evicting until the new item fits
+        - Counts hits, misses, inserts, updates, evictions and
+          expirations, optionally with get/put latency histograms
+        - Reports evictions to an optional listener instead of stdout
+        - Can consult an admission filter (e.g. TinyLFU) before evicting
+          for a new key, rejecting keys colder than the victim. The
+          filter only counts gets, so it suits read-through use (get,
+          then put on a miss); without gets every key ties at zero and,
+          once full, the cache keeps the keys it has
+    """
+
+    SWEEP_SAMPLE = 20  # Keys checked per sweeper round
+    SWEEP_REPEAT = 0.25  # Sample again while more than this ratio expired
+
+    def __init__(self, default_ttl=None, max_weight=None, weigher=weigh,
+                 on_evict=None, latency=False, admission=None):
+        """ Initialize the cache
+            Args:
+                default_ttl: Lifetime in seconds of items put without
+                             an explicit ttl, or None to never expire
+                max_weight: Capacity in weight units (bytes with the
+                            default weigher), replacing MAX_ITEMS
+                weigher: Function returning the weight of an item
+                on_evict: Function called with (key, item) on eviction,
+                          e.g. print_discard
+                latency: Whether to record get/put latency histograms
+                admission: Object with record(key) and
+                           admit(candidate, victim), fed by get only
+        """
+        super().__init__()
+        self.default_ttl = default_ttl
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.weights = {}  # Key -> weight, only filled when max_weight set
+        self.total_weight = 0
+        self.lock = threading.RLock()
+        self.expires = {}  # Key -> monotonic deadline
+        self._expiring = []  # Keys with a deadline, for O(1) sampling
+        self._slots = {}  # Key -> position in _expiring
+        self.on_evict = on_evict
+        self.admission = admission
+        self.hits = 0
+        self.misses = 0
+        self.inserts = 0
+        self.updates = 0
+        self.evictions = 0  # Items discarded to make room
+        self.expirations = 0  # Items dropped because their TTL ran out
+        self.rejections = 0  # New keys refused by the admission filter
+        self.get_latency = Histogram() if latency else None
+        self.put_latency = Histogram() if latency else None
+        self._sweeper = None
+        self._sweeper_stop = None
+
+    def _on_insert(self, key):
+        """ Record a new key
+            Args:
+                key: The key that was added
+        """
+
+    def _on_update(self, key):
+        """ Record an overwrite of an existing key
+            Args:
+                key: The key that was overwritten
+        """
+
+    def _on_access(self, key):
+        """ Record a read of an existing key
+            Args:
+                key: The key that was read
+        """
+
+    def _on_remove(self, key):
+        """ Forget a key that left the cache
+            Args:
+                key: The key that was removed
+        """
+
+    def _victim(self, exclude=None):
+        """ Choose the key to discard when the cache is full
+            Args:
+                exclude: A key that must not be chosen
+            Returns:
+                The key to discard
+        """
+        raise NotImplementedError("_victim must be implemented by policies")
+
+    def _is_full(self, weight):
+        """ Check whether an item needs an eviction first
+            Args:
+                weight: The weight of the incoming item
+            Returns:
+                True if the cache has no room for the item
+        """
+        if self.max_weight is None:
+            return len(self.cache_data) >= self.MAX_ITEMS
+        return self.total_weight + weight > self.max_weight
+
+    def put(self, key, item, ttl=None):
+        """ Add an item to the cache, evicting according to the policy
+            Args:
+                key: The key for the item
+                item: The item to be stored
+                ttl: Lifetime in seconds, defaults to default_ttl
+        """
+        if key is None or item is None:
+            return
+        if self.put_latency is None:
+            self._put(key, item, ttl)
+            return
+        start = time.perf_counter()
+        self._put(key, item, ttl)
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.put_latency.observe(elapsed)
+
+    def get(self, key):
+        """ Retrieve an item from the cache by key
+            Args:
+                key: The key of the item to retrieve
+            Returns:
+                The item associated with the key, or None if key doesn't
+                exist or has expired
+        """
+        if self.get_latency is None:
+            return self._get(key)
+        start = time.perf_counter()
+        item = self._get(key)
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.get_latency.observe(elapsed)
+        return item
+
+    def _put(self, key, item, ttl):
+        """ Add an item to the cache, see put
+        """
+        with self.lock:
+            weight = 0
+            if self.max_weight is not None:
+                weight = self.weigher(item)
+                if weight > self.max_weight:
+                    # The item can never fit, drop the stale copy instead
+                    if key in self.cache_data:
+                        self._remove(key)
+                    return
+            if key in self.cache_data:
+                self.updates += 1
+                self._on_update(key)
+                if self.max_weight is not None:
+                    self.total_weight -= self.weights[key]
+                    self._make_room(weight, key)
+            else:
+                if (self.admission is not None and self.cache_data and
+                        self._is_full(weight) and
+                        not self.admission.admit(key, self._victim(key))):
+                    self.rejections += 1
+                    return
+                self.inserts += 1
+                self._make_room(weight, key)
+                self._on_insert(key)
+            self.cache_data[key] = item
+            if self.max_weight is not None:
+                self.weights[key] = weight
+                self.total_weight += weight
+            self._set_deadline(key, self.default_ttl if ttl is None else ttl)
+
+    def _get(self, key):
+        """ Retrieve an item from the cache by key, see get
+        """
+        with self.lock:
+            if self.admission is not None and key is not None:
+                self.admission.record(key)
+            if key is None or key not in self.cache_data:
+                self.misses += 1
+                return None
+            deadline = self.expires.get(key)
+            if deadline is not None and deadline <= time.monotonic():
+                self._expire(key)
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._on_access(key)
+            return self.cache_data[key]
+
+    def delete(self, key):
+        """ Remove an item from the cache, if present
+            Args:
+                key: The key of the item to remove
+            Returns:
+                True if the item was cached
+        """
+        with self.lock:
+            if key is None or key not in self.cache_data:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self):
+        """ Remove every item from the cache, keeping the counters
+        """
+        with self.lock:
+            for key in list(self.cache_data):
+                self._remove(key)
+
+    def _make_room(self, weight, key):
+        """ Evict until an item fits
+            Args:
+                weight: The weight of the incoming item
+                key: The key being put, which is never evicted
+        """
+        keep = 1 if key in self.cache_data else 0
+        while len(self.cache_data) > keep and self._is_full(weight):
+            self._evict(key)
+
+    def _evict(self, exclude=None):
+        """ Discard the key chosen by the policy, or expire it if its TTL
+            already ran out
+            Args:
+                exclude: A key that must not be discarded
+        """
+        key = self._victim(exclude)
+        deadline = self.expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._expire(key)
+            return
+        item = self.cache_data[key]
+        self._remove(key)
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(key, item)
+
+    def _expire(self, key):
+        """ Drop a key whose TTL ran out
+            Args:
+                key: The expired key
+        """
+        self._remove(key)
+        self.expirations += 1
+
+    def _remove(self, key):
+        """ Remove a key from the cache and all policy bookkeeping
+            Args:
+                key: The key to remove
+        """
+        self._on_remove(key)
+        del self.cache_data[key]
+        if self.max_weight is not None:
+            self.total_weight -= self.weights.pop(key)
+        self._set_deadline(key, None)
+
+    def _set_deadline(self, key, ttl):
+        """ Set or clear the expiry deadline of a key
+            Args:
+                key: The key to update
+                ttl: Lifetime in seconds, or None to never expire
+        """
+        if ttl is None:
+            if key in self.expires:
+                del self.expires[key]
+                # Swap-remove keeps _expiring dense for random sampling
+                slot = self._slots.pop(key)
+                last = self._expiring.pop()
+                if last != key:
+                    self._expiring[slot] = last
+                    self._slots[last] = slot
+            return
+        if key not in self.expires:
+            self._slots[key] = len(self._expiring)
+            self._expiring.append(key)
+        self.expires[key] = time.monotonic() + ttl
+
+    def sweep(self, sample=None):
+        """ Drop expired items by random sampling, like Redis active expiry
+            Args:
+                sample: Keys checked per round, defaults to SWEEP_SAMPLE
+            Returns:
+                The number of items expired
+        """
+        sample = sample or self.SWEEP_SAMPLE
+        total = 0
+        with self.lock:
+            while self._expiring:
+                now = time.monotonic()
+                keys = random.sample(self._expiring,
+                                     min(sample, len(self._expiring)))
+                expired = [k for k in keys if self.expires[k] <= now]
+                for key in expired:
+                    self._expire(key)
+                total += len(expired)
+                if len(expired) <= len(keys) * self.SWEEP_REPEAT:
+                    break
+        return total
+
+    def start_sweeper(self, interval=0.1, sample=None):
+        """ Run sweep periodically in a daemon thread
+            Args:
+                interval: Seconds between two sweeps
+                sample: Keys checked per round, defaults to SWEEP_SAMPLE
+        """
+        if self._sweeper is not None:
+            return
+        self._sweeper_stop = threading.Event()
+
+        def run(stop):
+            """ Sweep until stopped """
+            while not stop.wait(interval):
+                self.sweep(sample)
+
+        self._sweeper = threading.Thread(target=run,
+                                         args=(self._sweeper_stop,),
+                                         daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self):
+        """ Stop the sweeper thread started by start_sweeper
+        """
+        if self._sweeper is None:
+            return
+        self._sweeper_stop.set()
+        self._sweeper.join()
+        self._sweeper = None
+        self._sweeper_stop = None
+
+    def stats(self):
+        """ Snapshot of the cache counters
+            Returns:
+                A dict of counters, gauges and latency histograms
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            stats = {
+                'policy': type(self).__name__,
+                'items': len(self.cache_data),
+                'total_weight': self.total_weight,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'inserts': self.inserts,
+                'updates': self.updates,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'rejections': self.rejections,
+            }
+            if self.get_latency is not None:
+                stats['get_latency'] = self.get_latency.as_dict()
+                stats['put_latency'] = self.put_latency.as_dict()
+        return stats
+
+    def stats_prometheus(self, prefix="cache"):
+        """ Cache counters in the Prometheus text exposition format
+            Args:
+                prefix: The metric name prefix
+            Returns:
+                The metrics as a string
+        """
+        return to_prometheus(self.stats(), prefix)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+""" Benchmark for the LRU and MRU caching modules
+
+Measures put/get throughput while BaseCaching.MAX_ITEMS grows from
+4 to 1M. With O(1) bookkeeping the ops/sec column stays roughly flat.
+
+Usage:
+    ./bench_lru_mru.py [ops]
+"""
+
+import random
+import sys
+import time
+
+from base_caching import BaseCaching
+
+LRUCache = __import__('3-lru_cache').LRUCache
+MRUCache = __import__('4-mru_cache').MRUCache
+
+SIZES = [4, 100, 10000, 100000, 1000000]
+
+
+def run(cache_class, max_items, ops):
+    """ Fill a cache of max_items entries, then time a mixed workload
+        Args:
+            cache_class: The caching class to benchmark
+            max_items: Value used for BaseCaching.MAX_ITEMS
+            ops: Number of timed put/get operations
+        Returns:
+            The number of operations per second
+    """
+    BaseCaching.MAX_ITEMS = max_items
+    cache = cache_class()
+    rng = random.Random(max_items)
+    keys = [rng.randrange(max_items * 2) for _ in range(ops)]
+
+    for key in range(max_items):
+        cache.put(key, key)
+    start = time.perf_counter()
+    for i, key in enumerate(keys):
+        if i & 1:
+            cache.get(key)
+        else:
+            cache.put(key, i)
+    return ops / (time.perf_counter() - start)
+
+
+def main():
+    """ Print ops/sec for every cache class and size
+    """
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    default_max = BaseCaching.MAX_ITEMS
+    print(f"{'class':<10}{'MAX_ITEMS':>12}{'ops/sec':>14}")
+    try:
+        for cache_class in (LRUCache, MRUCache):
+            for size in SIZES:
+                rate = run(cache_class, size, ops)
+                print(f"{cache_class.__name__:<10}{size:>12}{rate:>14,.0f}")
+    finally:
+        BaseCaching.MAX_ITEMS = default_max
+
+
+if __name__ == "__main__":
+    main()
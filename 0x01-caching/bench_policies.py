@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+""" Trace-driven hit ratio benchmark for the eviction policies
+
+Replays synthetic traces against every policy with a read-through
+pattern (get, then put on a miss) and prints the hit ratios:
+    - zipf: skewed popularity, the common web workload
+    - scan: the zipf trace interleaved with long sequential scans
+            over keys that are never seen again
+    - loop: a cyclic sweep over a working set 50% larger than the cache
+    - shift: a zipf trace whose hot keys change every quarter, which
+             punishes policies that never forget old frequencies
+
+TinyLFU rows put the admission filter in front of LRU and ARC. The
+metadata line compares LFUCache frequency bookkeeping with the fixed
+size of the TinyLFU sketch and doorkeeper after the zipf trace.
+
+Usage:
+    ./bench_policies.py [cache_size] [trace_length]
+"""
+
+import random
+import sys
+from itertools import accumulate
+
+FIFOCache = __import__('1-fifo_cache').FIFOCache
+LIFOCache = __import__('2-lifo_cache').LIFOCache
+LRUCache = __import__('3-lru_cache').LRUCache
+MRUCache = __import__('4-mru_cache').MRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+ARCCache = __import__('102-arc_cache').ARCCache
+TinyLFU = __import__('103-tinylfu').TinyLFU
+
+POLICIES = [
+    ('FIFO', lambda size: FIFOCache()),
+    ('LIFO', lambda size: LIFOCache()),
+    ('LRU', lambda size: LRUCache()),
+    ('MRU', lambda size: MRUCache()),
+    ('LFU', lambda size: LFUCache()),
+    ('ARC', lambda size: ARCCache()),
+    ('TinyLFU+LRU', lambda size: LRUCache(admission=TinyLFU(size))),
+    ('TinyLFU+ARC', lambda size: ARCCache(admission=TinyLFU(size))),
+]
+
+
+def zipf_trace(length, keys, skew=1.0, seed=0):
+    """ Build a Zipf-distributed key trace
+        Args:
+            length: The number of requests
+            keys: The size of the key space
+            skew: The Zipf exponent
+            seed: The random seed
+        Returns:
+            A list of integer keys
+    """
+    rng = random.Random(seed)
+    cum_weights = list(accumulate(1 / (rank ** skew)
+                                  for rank in range(1, keys + 1)))
+    return rng.choices(range(keys), cum_weights=cum_weights, k=length)
+
+
+def scan_trace(length, keys, scan, seed=0):
+    """ Build a Zipf trace broken up by one-off sequential scans
+        Args:
+            length: The number of requests
+            keys: The size of the hot key space
+            scan: The length of every scan
+            seed: The random seed
+        Returns:
+            A list of keys
+    """
+    hot = zipf_trace(length, keys, seed=seed)
+    trace = []
+    for i in range(0, length, scan):
+        trace.extend(hot[i:i + scan])
+        trace.extend(f"scan-{i}-{j}" for j in range(scan))
+    return trace[:length]
+
+
+def shift_trace(length, keys, phases=4, seed=0):
+    """ Build a Zipf trace whose popular keys change between phases
+        Args:
+            length: The number of requests
+            keys: The size of the key space of every phase
+            phases: The number of popularity shifts
+            seed: The random seed
+        Returns:
+            A list of keys
+    """
+    trace = []
+    step = length // phases
+    for phase in range(phases):
+        trace.extend((phase, key) for key in
+                     zipf_trace(step, keys, seed=seed + phase))
+    return trace
+
+
+def loop_trace(length, keys):
+    """ Build a cyclic trace
+        Args:
+            length: The number of requests
+            keys: The number of keys in the loop
+        Returns:
+            A list of integer keys
+    """
+    return [i % keys for i in range(length)]
+
+
+def replay(factory, trace, size):
+    """ Replay a trace against a policy
+        Args:
+            factory: Function building the cache from its size
+            trace: The keys to request
+            size: The cache size, in items
+        Returns:
+            The cache after the replay
+    """
+    cache = factory(size)
+    cache.MAX_ITEMS = size
+    for key in trace:
+        if cache.get(key) is None:
+            cache.put(key, key)
+    return cache
+
+
+def lfu_metadata(cache):
+    """ Size of the frequency bookkeeping of an LFUCache
+        Args:
+            cache: The LFUCache
+        Returns:
+            The number of bytes used by freq and buckets
+    """
+    return (sys.getsizeof(cache.freq) + sys.getsizeof(cache.buckets) +
+            sum(sys.getsizeof(bucket) for bucket in cache.buckets.values()))
+
+
+def main():
+    """ Print the hit ratio of every policy on every trace
+    """
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    traces = {
+        'zipf': zipf_trace(length, size * 10),
+        'scan': scan_trace(length, size * 10, size * 2),
+        'loop': loop_trace(length, size * 3 // 2),
+        'shift': shift_trace(length, size * 10),
+    }
+    print(f"{'policy':<13}" + "".join(f"{name:>8}" for name in traces))
+    for name, factory in POLICIES:
+        ratios = [replay(factory, trace, size).stats()['hit_ratio']
+                  for trace in traces.values()]
+        print(f"{name:<13}" + "".join(f"{ratio:>8.3f}" for ratio in ratios))
+    lfu = replay(POLICIES[4][1], traces['zipf'], size)
+    print(f"metadata: LFUCache {lfu_metadata(lfu)} bytes, "
+          f"TinyLFU {TinyLFU(size).memory()} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+""" Contention benchmark for the sharded caching module
+
+Runs the same mixed put/get workload from 1 to 16 threads against a
+ShardedCache with a single shard (one global lock) and with several
+shards. Under CPython the GIL caps raw throughput, so the interesting
+column is how much of it survives as threads are added: a single lock
+makes threads queue behind each other, striped locks keep them apart.
+
+Usage:
+    ./bench_sharded.py [ops_per_thread]
+"""
+
+import random
+import sys
+import threading
+import time
+
+from base_caching import BaseCaching
+
+ShardedCache = __import__('101-sharded_cache').ShardedCache
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+THREADS = [1, 2, 4, 8, 16]
+SHARDS = [1, 16]
+MAX_ITEMS = 4096
+
+
+def worker(cache, keys, barrier):
+    """ Replay a key trace against the cache
+        Args:
+            cache: The shared cache
+            keys: The keys to use, one operation per key
+            barrier: Barrier used to start every thread together
+    """
+    barrier.wait()
+    for i, key in enumerate(keys):
+        if i & 3:
+            cache.get(key)
+        else:
+            cache.put(key, i)
+
+
+def run(policy, shards, threads, ops):
+    """ Time a multi-threaded workload
+        Args:
+            policy: The eviction policy used by every shard
+            shards: The number of shards
+            threads: The number of worker threads
+            ops: The number of operations per thread
+        Returns:
+            The total number of operations per second
+    """
+    cache = ShardedCache(policy, shards)
+    traces = []
+    for t in range(threads):
+        rng = random.Random(t)
+        traces.append([rng.randrange(MAX_ITEMS * 2) for _ in range(ops)])
+    barrier = threading.Barrier(threads + 1)
+    pool = [threading.Thread(target=worker, args=(cache, trace, barrier))
+            for trace in traces]
+    for thread in pool:
+        thread.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for thread in pool:
+        thread.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main():
+    """ Print ops/sec for every policy, shard count and thread count
+    """
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    default_max = BaseCaching.MAX_ITEMS
+    default_interval = sys.getswitchinterval()
+    BaseCaching.MAX_ITEMS = MAX_ITEMS
+    # Switch threads often so lock contention actually shows up
+    sys.setswitchinterval(0.0005)
+    print(f"{'policy':<10}{'shards':>8}{'threads':>9}{'ops/sec':>14}")
+    try:
+        for policy in (LRUCache, LFUCache):
+            for shards in SHARDS:
+                for threads in THREADS:
+                    rate = run(policy, shards, threads, ops)
+                    print(f"{policy.__name__:<10}{shards:>8}{threads:>9}"
+                          f"{rate:>14,.0f}")
+    finally:
+        BaseCaching.MAX_ITEMS = default_max
+        sys.setswitchinterval(default_interval)
+
+
+if __name__ == "__main__":
+    main()
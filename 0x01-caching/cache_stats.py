@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+""" Cache statistics module
+"""
+
+from bisect import bisect_left
+
+COUNTERS = {
+    'hits': "Lookups that found a live item",
+    'misses': "Lookups that found nothing or an expired item",
+    'inserts': "Puts that added a new key",
+    'updates': "Puts that overwrote an existing key",
+    'evictions': "Items discarded by the eviction policy",
+    'expirations': "Items dropped because their TTL ran out",
+    'rejections': "New keys refused by the admission filter",
+}
+GAUGES = {
+    'items': "Items currently cached",
+    'total_weight': "Total weight of the cached items",
+}
+
+
+class Histogram():
+    """ Histogram defines a fixed-bucket latency histogram that:
+        - Counts observations per upper bound, in seconds
+        - Can be merged with another histogram using the same bounds
+    """
+
+    BOUNDS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 1e-3, 1e-2)
+
+    def __init__(self, bounds=BOUNDS):
+        """ Initialize an empty histogram
+            Args:
+                bounds: Sorted bucket upper bounds, +Inf is implied
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """ Record one observation
+            Args:
+                value: The observed duration in seconds
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def merge(self, other):
+        """ Add the observations of another histogram to this one
+            Args:
+                other: A histogram with the same bounds
+        """
+        if other.bounds != self.bounds:
+            raise ValueError("histogram bounds differ")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+
+    def as_dict(self):
+        """ Export the histogram with cumulative buckets
+            Returns:
+                A dict with buckets (upper bound -> count), count and sum
+        """
+        buckets = {}
+        total = 0
+        for bound, count in zip(self.bounds + ('+Inf',), self.counts):
+            total += count
+            buckets[str(bound)] = total
+        return {'buckets': buckets, 'count': self.count, 'sum': self.sum}
+
+
+def to_prometheus(stats, prefix="cache"):
+    """ Render a stats dict in the Prometheus text exposition format
+        Args:
+            stats: A dict as returned by BasePolicy.stats
+            prefix: The metric name prefix
+        Returns:
+            The metrics as a string
+    """
+    label = f'policy="{stats["policy"]}"'
+    lines = []
+    for name, text in COUNTERS.items():
+        metric = f"{prefix}_{name}_total"
+        lines.append(f"# HELP {metric} {text}")
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric}{{{label}}} {stats[name]}")
+    for name, text in GAUGES.items():
+        metric = f"{prefix}_{name}"
+        lines.append(f"# HELP {metric} {text}")
+        lines.append(f"# TYPE {metric} gauge")
+        lines.append(f"{metric}{{{label}}} {stats[name]}")
+    for op in ('get', 'put'):
+        latency = stats.get(f"{op}_latency")
+        if latency is None:
+            continue
+        metric = f"{prefix}_{op}_seconds"
+        lines.append(f"# HELP {metric} Latency of {op} calls")
+        lines.append(f"# TYPE {metric} histogram")
+        for bound, count in latency['buckets'].items():
+            lines.append(f'{metric}_bucket{{{label},le="{bound}"}} {count}')
+        lines.append(f"{metric}_sum{{{label}}} {latency['sum']}")
+        lines.append(f"{metric}_count{{{label}}} {latency['count']}")
+    return "\n".join(lines) + "\n"
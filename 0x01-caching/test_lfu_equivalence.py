@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+""" Equivalence tests of the O(1) LFU cache against the original one
+"""
+
+import contextlib
+import io
+import random
+import unittest
+
+from base_caching import BaseCaching
+from base_policy import print_discard
+
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+
+class OldLFUCache(BaseCaching):
+    """ The original list-scanning LFUCache, kept as the reference:
+        - Discards the least frequently used item when the cache is full
+        - Uses LRU algorithm to break ties in frequency
+    """
+
+    def __init__(self):
+        """ Initialize the LFU cache
+        """
+        super().__init__()
+        self.freq = {}  # Tracks frequency of each key
+        self.lru_order = []  # Tracks recency order for LRU tiebreaker
+
+    def put(self, key, item):
+        """ Add an item to the cache using LFU strategy
+            Args:
+                key: The key for the item
+                item: The item to be stored
+        """
+        if key is None or item is None:
+            return
+
+        if key in self.cache_data:
+            self.lru_order.remove(key)
+        elif len(self.cache_data) >= BaseCaching.MAX_ITEMS:
+            min_freq = min(self.freq.values())
+            lfu_keys = [k for k in self.lru_order
+                        if self.freq[k] == min_freq]
+            lfu_key = lfu_keys[0]
+            self.lru_order.remove(lfu_key)
+            print(f"DISCARD: {lfu_key}")
+            del self.cache_data[lfu_key]
+            del self.freq[lfu_key]
+
+        self.cache_data[key] = item
+        self.lru_order.append(key)
+        self.freq[key] = self.freq.get(key, 0) + 1
+
+    def get(self, key):
+        """ Retrieve an item from the cache by key
+            Args:
+                key: The key of the item to retrieve
+            Returns:
+                The item associated with the key, or None if key doesn't exist
+        """
+        if key is None or key not in self.cache_data:
+            return None
+        self.freq[key] += 1
+        self.lru_order.remove(key)
+        self.lru_order.append(key)
+        return self.cache_data[key]
+
+
+class TestLFUEquivalence(unittest.TestCase):
+    """ Random traces replayed on both caches """
+
+    def setUp(self):
+        self.max_items = BaseCaching.MAX_ITEMS
+
+    def tearDown(self):
+        BaseCaching.MAX_ITEMS = self.max_items
+
+    def replay(self, seed, capacity, steps=300, keys=20):
+        """ Replay one trace, comparing results, evictions and contents
+            Args:
+                seed: The seed of the trace
+                capacity: The MAX_ITEMS of both caches
+                steps: The number of operations
+                keys: The size of the key space
+        """
+        BaseCaching.MAX_ITEMS = capacity
+        rng = random.Random(seed)
+        new, old = LFUCache(on_evict=print_discard), OldLFUCache()
+        for step in range(steps):
+            # Skewed keys, so that frequencies differ and ties still occur
+            key = int(rng.paretovariate(1.2)) % keys
+            if rng.random() < 0.1:
+                key = None
+            new_out, old_out = io.StringIO(), io.StringIO()
+            if rng.random() < 0.5:
+                item = rng.random()
+                with contextlib.redirect_stdout(new_out):
+                    new.put(key, item)
+                with contextlib.redirect_stdout(old_out):
+                    old.put(key, item)
+            else:
+                with contextlib.redirect_stdout(new_out):
+                    found = new.get(key)
+                with contextlib.redirect_stdout(old_out):
+                    expected = old.get(key)
+                self.assertEqual(found, expected, (seed, step))
+            self.assertEqual(new_out.getvalue(), old_out.getvalue(),
+                             (seed, step))
+            self.assertEqual(new.cache_data, old.cache_data, (seed, step))
+
+    def test_random_traces(self):
+        """ Same DISCARD lines, results and contents at every step """
+        for capacity in (1, 2, 4, 8):
+            for seed in range(50):
+                with self.subTest(capacity=capacity, seed=seed):
+                    self.replay(seed, capacity)
+
+    def test_uniform_keys(self):
+        """ Mostly ties on frequency, broken by recency """
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                self.replay(seed, 4, steps=500, keys=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
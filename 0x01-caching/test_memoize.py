@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+""" Tests for the memoization module
+"""
+
+import asyncio
+import unittest
+
+memoize = __import__('104-memoize').memoize
+
+
+class TestAsyncMemoize(unittest.TestCase):
+    """ Single-flight of coroutine functions """
+
+    def test_cancelled_leader_does_not_fail_waiters(self):
+        """ Cancelling the first caller leaves the second one its result """
+        calls = []
+
+        @memoize()
+        async def double(x):
+            calls.append(x)
+            await asyncio.sleep(0.02)
+            return x * 2
+
+        async def run():
+            leader = asyncio.ensure_future(double(2))
+            waiter = asyncio.ensure_future(double(2))
+            await asyncio.sleep(0.005)
+            leader.cancel()
+            self.assertEqual(await waiter, 4)
+            self.assertTrue(leader.cancelled())
+            self.assertEqual(await double(2), 4)
+
+        asyncio.run(run())
+        self.assertEqual(calls, [2])
+
+    def test_errors_reach_every_caller_and_are_not_cached(self):
+        """ Concurrent callers share one failure, the next call retries """
+        calls = []
+
+        @memoize()
+        async def fail(x):
+            calls.append(x)
+            await asyncio.sleep(0.005)
+            raise ValueError(x)
+
+        async def run():
+            return await asyncio.gather(fail(1), fail(1),
+                                        return_exceptions=True)
+
+        errors = asyncio.run(run())
+        self.assertEqual([type(error) for error in errors],
+                         [ValueError, ValueError])
+        asyncio.run(run())
+        self.assertEqual(calls, [1, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
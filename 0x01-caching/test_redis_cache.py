@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+""" Tests for the Redis caching module, against an in-memory stand-in
+"""
+
+import fnmatch
+import time
+import unittest
+
+RedisCache = __import__('105-redis_cache').RedisCache
+
+
+class FakeServer():
+    """ The keys, expiries and subscribers shared by FakeRedis clients """
+
+    def __init__(self):
+        self.data = {}
+        self.deadlines = {}
+        self.handlers = []
+
+    def alive(self, key):
+        """ Drop the key if it expired, then tell whether it exists """
+        deadline = self.deadlines.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            del self.data[key]
+            del self.deadlines[key]
+        return key in self.data
+
+
+class FakePubSub():
+    """ Calls the handlers synchronously when a message is published """
+
+    def __init__(self, server):
+        self.server = server
+        self.handlers = {}
+
+    def subscribe(self, **handlers):
+        self.handlers.update(handlers)
+        self.server.handlers.append(self.handlers)
+
+    def run_in_thread(self, sleep_time=0, daemon=True):
+        pubsub = self
+
+        class Listener():
+            def stop(self):
+                pubsub.server.handlers.remove(pubsub.handlers)
+
+        return Listener()
+
+
+class FakePipeline():
+    """ Queues commands and runs them on execute """
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        return lambda *args: self.commands.append((method, args))
+
+    def execute(self):
+        return [method(*args) for method, args in self.commands]
+
+
+class FakeRedis():
+    """ The subset of redis.Redis used by RedisCache """
+
+    def __init__(self, server=None):
+        self.server = FakeServer() if server is None else server
+
+    @staticmethod
+    def _encode(key):
+        return key.encode() if isinstance(key, str) else key
+
+    def pubsub(self, ignore_subscribe_messages=True):
+        return FakePubSub(self.server)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def mset(self, mapping):
+        for key, value in mapping.items():
+            key = self._encode(key)
+            self.server.data[key] = value
+            self.server.deadlines.pop(key, None)
+        return True
+
+    def mget(self, keys):
+        keys = [self._encode(key) for key in keys]
+        return [self.server.data[key] if self.server.alive(key) else None
+                for key in keys]
+
+    def pexpire(self, key, milliseconds):
+        key = self._encode(key)
+        if not self.server.alive(key):
+            return False
+        self.server.deadlines[key] = time.monotonic() + milliseconds / 1000
+        return True
+
+    def pttl(self, key):
+        key = self._encode(key)
+        if not self.server.alive(key):
+            return -2
+        deadline = self.server.deadlines.get(key)
+        if deadline is None:
+            return -1
+        return int((deadline - time.monotonic()) * 1000)
+
+    def delete(self, key):
+        key = self._encode(key)
+        if not self.server.alive(key):
+            return 0
+        del self.server.data[key]
+        self.server.deadlines.pop(key, None)
+        return 1
+
+    def publish(self, channel, message):
+        for handlers in list(self.server.handlers):
+            if channel in handlers:
+                handlers[channel]({'data': message.encode()})
+
+    def scan_iter(self, match):
+        return [key for key in list(self.server.data)
+                if self.server.alive(key) and
+                fnmatch.fnmatchcase(key.decode(), match)]
+
+    def close(self):
+        pass
+
+
+class TestRedisCache(unittest.TestCase):
+    """ Reads, writes and near-cache coherence """
+
+    def setUp(self):
+        self.server = FakeServer()
+        self.cache = RedisCache(client=FakeRedis(self.server))
+        self.other = RedisCache(client=FakeRedis(self.server))
+
+    def tearDown(self):
+        self.cache.close()
+        self.other.close()
+
+    def test_put_get(self):
+        """ Items round-trip through Redis and are shared """
+        self.cache.put("A", {"x": 1})
+        self.assertEqual(self.cache.get("A"), {"x": 1})
+        self.assertEqual(self.other.get("A"), {"x": 1})
+        self.assertIsNone(self.cache.get("B"))
+        self.assertEqual(self.cache.cache_data, {"A": {"x": 1}})
+
+    def test_many(self):
+        """ Batches skip None keys and items """
+        self.cache.put_many({"A": 1, "B": 2, None: 3, "C": None})
+        self.assertEqual(self.other.get_many(["A", "B", "C"]),
+                         {"A": 1, "B": 2})
+
+    def test_invalidation(self):
+        """ A write or delete drops the other near-cache copies """
+        self.cache.put("A", 1)
+        self.assertEqual(self.other.get("A"), 1)
+        self.cache.put("A", 2)
+        self.assertEqual(self.other.get("A"), 2)
+        self.assertTrue(self.cache.delete("A"))
+        self.assertIsNone(self.other.get("A"))
+
+    def race_fetch(self, cache, write):
+        """ Run write right after the next MGET of cache returns
+            Args:
+                cache: The RedisCache whose fetch is raced
+                write: Function changing the item in between
+        """
+        client = cache.client
+        mget = client.mget
+
+        def racing_mget(keys):
+            values = mget(keys)
+            client.mget = mget
+            write()
+            return values
+
+        client.mget = racing_mget
+
+    def test_write_during_fetch_is_not_cached(self):
+        """ A value fetched before another process's write is not kept """
+        self.cache.put("A", 1)
+        self.race_fetch(self.other, lambda: self.cache.put("A", 2))
+        self.assertEqual(self.other.get("A"), 1)
+        self.assertEqual(self.other.get("A"), 2)
+
+    def test_delete_during_fetch_is_not_cached(self):
+        """ A value fetched before another process's delete is not kept """
+        self.cache.put("A", 1)
+        self.race_fetch(self.other, lambda: self.cache.delete("A"))
+        self.assertEqual(self.other.get("A"), 1)
+        self.assertIsNone(self.other.get("A"))
+
+    def test_near_copy_expires_with_redis_key(self):
+        """ A copy fetched from Redis keeps the key's remaining lifetime """
+        self.cache.put("A", 1, ttl=0.05)
+        self.assertEqual(self.other.get("A"), 1)
+        time.sleep(0.1)
+        self.assertIsNone(self.other.get("A"))
+        self.assertIsNone(self.cache.get("A"))
+
+    def test_near_copy_without_ttl(self):
+        """ A key without expiry is served from the near-cache """
+        self.cache.put("A", 1)
+        self.assertEqual(self.other.get("A"), 1)
+        self.server.data.clear()
+        self.assertEqual(self.other.get("A"), 1)
+
+    def test_without_near_cache(self):
+        """ near_items=0 reads every item from Redis """
+        cache = RedisCache(client=FakeRedis(self.server), near_items=0)
+        cache.put("A", 1)
+        self.server.data.clear()
+        self.assertIsNone(cache.get("A"))
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
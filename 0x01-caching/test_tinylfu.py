@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+""" Tests for the TinyLFU admission module
+"""
+
+import unittest
+
+tinylfu = __import__('103-tinylfu')
+CountMinSketch = tinylfu.CountMinSketch
+Doorkeeper = tinylfu.Doorkeeper
+TinyLFU = tinylfu.TinyLFU
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class TestHashes(unittest.TestCase):
+    """ Slot indexes of neighbouring keys """
+
+    def test_rows_are_independent(self):
+        """ Small ints do not all step by the same stride between rows """
+        strides = {tinylfu._hashes(key, 2, 1023)[1] -
+                   tinylfu._hashes(key, 2, 1023)[0] for key in range(100)}
+        self.assertGreater(len(strides), 50)
+
+
+class TestCountMinSketch(unittest.TestCase):
+    """ Frequency estimates """
+
+    def test_counts_seen_keys(self):
+        """ A key added n times estimates at least n """
+        sketch = CountMinSketch(64)
+        for _ in range(10):
+            sketch.add(5)
+        self.assertEqual(sketch.estimate(5), 10)
+
+    def test_unseen_keys_do_not_inherit_counts(self):
+        """ Keys equal modulo the width do not share every counter """
+        sketch = CountMinSketch(64)
+        for _ in range(10):
+            sketch.add(5)
+        self.assertEqual(sketch.estimate(133), 0)
+        inherited = [key for key in range(6, 10000)
+                     if sketch.estimate(key)]
+        self.assertEqual(inherited, [])
+
+    def test_halve(self):
+        """ Aging divides counters by two """
+        sketch = CountMinSketch(64)
+        for _ in range(9):
+            sketch.add('a')
+        sketch.halve()
+        self.assertEqual(sketch.estimate('a'), 4)
+
+
+class TestDoorkeeper(unittest.TestCase):
+    """ Bloom filter membership """
+
+    def test_neighbours_are_absent(self):
+        """ Adding 1 and 4 does not make 2 and 3 present """
+        doorkeeper = Doorkeeper(64)
+        doorkeeper.add(1)
+        doorkeeper.add(4)
+        self.assertIn(1, doorkeeper)
+        self.assertIn(4, doorkeeper)
+        self.assertNotIn(2, doorkeeper)
+        self.assertNotIn(3, doorkeeper)
+
+    def test_false_positive_rate(self):
+        """ 100 keys in 1024 bits give few false positives """
+        doorkeeper = Doorkeeper(1024)
+        for key in range(100):
+            doorkeeper.add(key)
+        false = sum(key in doorkeeper for key in range(100, 10100))
+        self.assertLess(false / 10000, 0.05)
+
+
+class TestTinyLFU(unittest.TestCase):
+    """ Admission decisions """
+
+    def test_admits_more_frequent_candidate(self):
+        """ A hot candidate beats a cold victim, not the reverse """
+        admission = TinyLFU(64)
+        for _ in range(5):
+            admission.record('hot')
+        admission.record('cold')
+        self.assertTrue(admission.admit('hot', 'cold'))
+        self.assertFalse(admission.admit('cold', 'hot'))
+        self.assertFalse(admission.admit(12345, 'cold'))
+
+
+class TestAdmission(unittest.TestCase):
+    """ TinyLFU in front of a policy, fed by its gets """
+
+    def test_read_through_admits_hot_keys(self):
+        """ A key missed often enough replaces a cold one """
+        cache = LRUCache(admission=TinyLFU(4))
+        for key in range(4):
+            cache.put(key, key)
+        for _ in range(3):
+            if cache.get('hot') is None:
+                cache.put('hot', 'hot')
+        self.assertIn('hot', cache.cache_data)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_put_only_keeps_the_first_keys(self):
+        """ Without gets, new keys tie with the victim and are rejected """
+        cache = LRUCache(admission=TinyLFU(4))
+        for key in range(10):
+            cache.put(key, key)
+        self.assertEqual(sorted(cache.cache_data), [0, 1, 2, 3])
+        self.assertEqual(cache.rejections, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ selector and translated template content using message IDs.
 
 from flask import Flask, render_template, request
 from flask_babel import Babel, _
+from catalogs import CatalogManager
 from typing import Any, Optional
 
 class Config:
@@ -24,6 +25,7 @@ class Config:
 app = Flask(__name__)
 app.config.from_object(Config)
 babel = Babel(app)
+catalog_manager = CatalogManager(app, babel)
 
 @babel.localeselector
 def get_locale() -> Optional[str]:
@@ -7,8 +7,10 @@ configured with Babel for language and timezone support, and includes a locale
 selector that prioritizes a 'locale' query parameter if provided and valid.
 """
 
-from flask import Flask, render_template, request
+from flask import Flask, render_template, request, g
 from flask_babel import Babel, _
+from catalogs import CatalogManager
+from locale_negotiation import LocaleNegotiator
 from typing import Any, Optional
 
 class Config:
@@ -24,25 +26,33 @@ class Config:
 app = Flask(__name__)
 app.config.from_object(Config)
 babel = Babel(app)
+catalog_manager = CatalogManager(app, babel)
+negotiator = LocaleNegotiator(Config.LANGUAGES, Config.BABEL_DEFAULT_LOCALE)
 
 @babel.localeselector
-def get_locale() -> Optional[str]:
+def get_locale() -> str:
     """
     Determines the best match for supported languages based on query parameter or
     client preferences.
 
     Checks for a 'locale' query parameter first; if present and valid, returns it.
-    Otherwise, uses request.accept_languages to select the best language from the
-    configured LANGUAGES list.
+    Otherwise, uses the negotiator to select the best language from the
+    Accept-Language header, with fallbacks such as 'fr-CA' -> 'fr'. The result
+    is memoized on flask.g, so later calls in the same request are free.
 
     Returns:
-        Optional[str]: The selected language code (e.g., 'en' or 'fr'),
-                       or None if no match is found.
+        str: The selected language code (e.g., 'en' or 'fr'),
+             BABEL_DEFAULT_LOCALE if nothing matches.
     """
-    locale = request.args.get('locale')
-    if locale in app.config['LANGUAGES']:
-        return locale
-    return request.accept_languages.best_match(app.config['LANGUAGES'])
+    if 'locale' not in g:
+        g.locale = negotiator.negotiate(
+            request.args.get('locale'),
+            header=request.headers.get('Accept-Language'))
+    return g.locale
+
+
+app.jinja_env.globals['get_locale'] = get_locale
+
 
 @app.route('/')
 def index() -> str:
@@ -10,6 +10,8 @@ login system using a 'login_as' query parameter to set flask.g.user.
 
 from flask import Flask, render_template, request, g
 from flask_babel import Babel, _
+from catalogs import CatalogManager
+from locale_negotiation import LocaleNegotiator
 from typing import Any, Optional, Dict
 
 class Config:
@@ -25,6 +27,8 @@ class Config:
 app = Flask(__name__)
 app.config.from_object(Config)
 babel = Babel(app)
+catalog_manager = CatalogManager(app, babel)
+negotiator = LocaleNegotiator(Config.LANGUAGES, Config.BABEL_DEFAULT_LOCALE)
 
 users = {
     1: {"name": "Balou", "locale": "fr", "timezone": "Europe/Paris"},
@@ -56,7 +60,7 @@ def before_request() -> None:
     g.user = get_user()
 
 @babel.localeselector
-def get_locale() -> Optional[str]:
+def get_locale() -> str:
     """
     Determines the best match for supported languages based on query parameter,
     user settings, or client preferences.
@@ -64,22 +68,27 @@ def get_locale() -> Optional[str]:
     Priority order:
     1. 'locale' query parameter, if valid.
     2. User's preferred locale from user settings, if valid.
-    3. Best match from request.accept_languages.
+    3. Best match from the Accept-Language header, with fallbacks such as
+       'fr-CA' -> 'fr'.
     4. Default locale from BABEL_DEFAULT_LOCALE.
 
+    The result is memoized on flask.g, so later calls in the same request
+    are free.
+
     Returns:
-        Optional[str]: The selected language code (e.g., 'en' or 'fr'),
-                       or None if no match is found.
+        str: The selected language code (e.g., 'en' or 'fr'),
+             BABEL_DEFAULT_LOCALE if nothing matches.
     """
-    # Check URL parameter
-    locale = request.args.get('locale')
-    if locale in app.config['LANGUAGES']:
-        return locale
-    # Check user settings
-    if g.user and g.user.get('locale') in app.config['LANGUAGES']:
-        return g.user['locale']
-    # Check request header
-    return request.accept_languages.best_match(app.config['LANGUAGES'])
+    if 'locale' not in g:
+        g.locale = negotiator.negotiate(
+            request.args.get('locale'),
+            g.user.get('locale') if g.user else None,
+            header=request.headers.get('Accept-Language'))
+    return g.locale
+
+
+app.jinja_env.globals['get_locale'] = get_locale
+
 
 @app.route('/')
 def index() -> str:
@@ -9,9 +9,13 @@ selector with similar logic, and a mock user login system using a 'login_as' que
 parameter to set flask.g.user.
 """
 
-from flask import Flask, render_template, request, g
+from flask import Flask, Response, render_template, request, g
 from flask_babel import Babel, _
-import pytz
+from catalogs import CatalogManager
+from datetime import tzinfo
+from locale_negotiation import LocaleNegotiator
+from response_cache import ResponseCache
+from timezone_resolver import TimezoneResolver
 from typing import Any, Optional, Dict
 
 class Config:
@@ -27,6 +31,10 @@ class Config:
 app = Flask(__name__)
 app.config.from_object(Config)
 babel = Babel(app)
+negotiator = LocaleNegotiator(Config.LANGUAGES, Config.BABEL_DEFAULT_LOCALE)
+resolver = TimezoneResolver(Config.BABEL_DEFAULT_TIMEZONE)
+pages = ResponseCache()
+catalog_manager = CatalogManager(app, babel, on_reload=pages.invalidate)
 
 users = {
     1: {"name": "Balou", "locale": "fr", "timezone": "Europe/Paris"},
@@ -58,7 +66,7 @@ def before_request() -> None:
     g.user = get_user()
 
 @babel.localeselector
-def get_locale() -> Optional[str]:
+def get_locale() -> str:
     """
     Determines the best match for supported languages based on query parameter,
     user settings, or client preferences.
@@ -66,68 +74,72 @@ def get_locale() -> Optional[str]:
     Priority order:
     1. 'locale' query parameter, if valid.
     2. User's preferred locale from user settings, if valid.
-    3. Best match from request.accept_languages.
+    3. Best match from the Accept-Language header, with fallbacks such as
+       'fr-CA' -> 'fr'.
     4. Default locale from BABEL_DEFAULT_LOCALE.
 
+    The result is memoized on flask.g, so later calls in the same request
+    are free.
+
     Returns:
-        Optional[str]: The selected language code (e.g., 'en' or 'fr'),
-                       or None if no match is found.
+        str: The selected language code (e.g., 'en' or 'fr'),
+             BABEL_DEFAULT_LOCALE if nothing matches.
     """
-    locale = request.args.get('locale')
-    if locale in app.config['LANGUAGES']:
-        return locale
-    if g.user and g.user.get('locale') in app.config['LANGUAGES']:
-        return g.user['locale']
-    return request.accept_languages.best_match(app.config['LANGUAGES'])
+    if 'locale' not in g:
+        g.locale = negotiator.negotiate(
+            request.args.get('locale'),
+            g.user.get('locale') if g.user else None,
+            header=request.headers.get('Accept-Language'))
+    return g.locale
+
+
+app.jinja_env.globals['get_locale'] = get_locale
+
 
 @babel.timezoneselector
-def get_timezone() -> str:
+def get_timezone() -> tzinfo:
     """
-    Determines the timezone based on query parameter, user settings, or default.
+    Determines the timezone based on query parameter, user settings, or
+    default.
 
     Priority order:
     1. 'timezone' query parameter, if valid.
     2. User's preferred timezone from user settings, if valid.
     3. Default timezone from BABEL_DEFAULT_TIMEZONE ('UTC').
 
-    Validates timezones using pytz.timezone, catching UnknownTimeZoneError.
+    Names are checked by the resolver against the preloaded tz database
+    names, and the resolved tzinfo is handed to Babel as is.
 
     Returns:
-        str: The selected timezone (e.g., 'UTC', 'Europe/Paris').
+        tzinfo: The selected timezone (e.g., UTC, Europe/Paris).
     """
-    # Check URL parameter
-    timezone = request.args.get('timezone')
-    if timezone:
-        try:
-            pytz.timezone(timezone)
-            return timezone
-        except pytz.exceptions.UnknownTimeZoneError:
-            pass
-    # Check user settings
-    if g.user and g.user.get('timezone'):
-        try:
-            pytz.timezone(g.user['timezone'])
-            return g.user['timezone']
-        except pytz.exceptions.UnknownTimeZoneError:
-            pass
-    # Default to UTC
-    return app.config['BABEL_DEFAULT_TIMEZONE']
+    return resolver.select(request.args.get('timezone'),
+                           g.user.get('timezone') if g.user else None)
 
 @app.route('/')
-def index() -> str:
+def index() -> Response:
     """
     Renders the index page with translated title, header, and login message.
 
-    Uses _() to translate message IDs 'home_title', 'home_header', 'logged_in_as',
-    and 'not_logged_in'. Displays a welcome message if a user is logged in.
+    Uses _() to translate message IDs 'home_title', 'home_header',
+    'logged_in_as', and 'not_logged_in'. Displays a welcome message if a user
+    is logged in.
+
+    The page only depends on the locale, the timezone and the user's name, so
+    it is rendered once per combination and then served from the response
+    cache, with a 304 Not Modified for clients sending its current ETag.
 
     Returns:
-        str: Rendered HTML content of the index page.
+        Response: Rendered HTML content of the index page.
     """
-    return render_template('7-index.html',
-                           home_title=_('home_title'),
-                           home_header=_('home_header'),
-                           login_message=_('logged_in_as', username=g.user['name']) if g.user else _('not_logged_in'))
+    name = g.user['name'] if g.user else None
+    key = (get_locale(), str(get_timezone()), name)
+    return pages.respond(key, lambda: render_template(
+        '7-index.html',
+        home_title=_('home_title'),
+        home_header=_('home_header'),
+        login_message=_('logged_in_as', username=name) if g.user
+        else _('not_logged_in')))
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000)
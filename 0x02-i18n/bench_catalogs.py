@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark of translation catalog loading.
+
+For each locale, builds fresh copies of 7-app.py and times the first
+request in that locale, with the template already compiled so only the
+catalog work differs:
+    - lazy: Flask-Babel's cache emptied, so the request loads the catalog
+    - preloaded: catalogs loaded at import by catalogs.preload
+A warm request is timed as well, as the floor both should reach.
+
+Usage:
+    ./bench_catalogs.py [repeats]
+"""
+
+import importlib.util
+import os
+import statistics
+import sys
+import time
+
+from catalogs import compile_catalogs
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), '7-app.py')
+
+
+def fresh_app(number):
+    """Imports a new copy of 7-app.py, with its own Flask and Babel."""
+    spec = importlib.util.spec_from_file_location(
+        'bench_app_{}'.format(number), APP)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.app.jinja_env.get_template('7-index.html')
+    return module
+
+
+def timed_get(client, locale):
+    """Duration of one request in a locale, in seconds."""
+    start = time.perf_counter()
+    response = client.get('/?locale={}'.format(locale))
+    elapsed = time.perf_counter() - start
+    assert response.status_code == 200, response.status_code
+    return elapsed
+
+
+def main():
+    """Print the median first and warm request latency per locale."""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    compile_catalogs()
+    number = 0
+    print("{:<8}{:<11}{:>12}{:>12}".format(
+        "locale", "catalogs", "first", "warm"))
+    for locale in fresh_app(number).Config.LANGUAGES:
+        for mode in ('lazy', 'preloaded'):
+            first, warm = [], []
+            for _ in range(repeats):
+                number += 1
+                module = fresh_app(number)
+                if mode == 'lazy':
+                    module.babel.domain_instance.cache.clear()
+                client = module.app.test_client()
+                first.append(timed_get(client, locale))
+                warm.append(timed_get(client, locale))
+            print("{:<8}{:<11}{:>10.0f}us{:>10.0f}us".format(
+                locale, mode, statistics.median(first) * 1e6,
+                statistics.median(warm) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
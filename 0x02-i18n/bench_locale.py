@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of locale negotiation.
+
+Replays Accept-Language headers drawn from a realistic, skewed mix of
+browser headers against:
+    - werkzeug: parsing the header into LanguageAccept and calling
+      best_match, as request.accept_languages does on every request
+    - negotiator: LocaleNegotiator.best_match with its LRU cache
+and checks that both pick the same locale for every header.
+
+Usage:
+    ./bench_locale.py [requests]
+"""
+
+import random
+import sys
+import time
+
+from werkzeug.datastructures import LanguageAccept
+from werkzeug.http import parse_accept_header
+
+from locale_negotiation import LocaleNegotiator
+
+LANGUAGES = ["en", "fr"]
+
+# Common browser headers, most frequent first
+HEADERS = [
+    "en-US,en;q=0.9",
+    "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
+    "en-GB,en;q=0.9",
+    "en-US,en;q=0.5",
+    "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
+    "fr-CA,fr;q=0.9,en-CA;q=0.8,en;q=0.7",
+    "en-US",
+    "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7",
+    "es-ES,es;q=0.9,en;q=0.8",
+    "fr-BE,fr;q=0.9,nl;q=0.8,en;q=0.7",
+    "en-CA,en-US;q=0.9,en;q=0.8,fr-CA;q=0.7,fr;q=0.6",
+    "*",
+    "it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7",
+    "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+    "ja,en-US;q=0.9,en;q=0.8",
+    "fr-CH, fr;q=0.9, en;q=0.8, de;q=0.7, *;q=0.5",
+    "zh-CN,zh;q=0.9",
+]
+
+
+def werkzeug_best_match(header):
+    """The current selector: parse the header, then best_match."""
+    accept = parse_accept_header(header, LanguageAccept)
+    return accept.best_match(LANGUAGES)
+
+
+def main():
+    """Print the time per header of both selectors."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(0)
+    weights = [1 / (rank + 1) for rank in range(len(HEADERS))]
+    trace = rng.choices(HEADERS, weights, k=count)
+    negotiator = LocaleNegotiator(LANGUAGES, "en")
+
+    for header in HEADERS:
+        old = werkzeug_best_match(header)
+        new = negotiator.best_match(header)
+        if old != new:
+            print("differs: {!r}: werkzeug {}, negotiator {}".format(
+                header, old, new))
+
+    print("{} headers, {} distinct".format(count, len(HEADERS)))
+    baseline = None
+    for name, select in (("werkzeug", werkzeug_best_match),
+                         ("negotiator", LocaleNegotiator(
+                             LANGUAGES, "en").best_match)):
+        start = time.perf_counter()
+        for header in trace:
+            select(header)
+        elapsed = (time.perf_counter() - start) / count
+        baseline = baseline or elapsed
+        print("{:<12}{:>8.2f}us{:>8.1f}x".format(
+            name, elapsed * 1e6, baseline / elapsed))
+
+
+if __name__ == "__main__":
+    main()
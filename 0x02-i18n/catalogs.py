@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Translation catalog module for the i18n Flask applications.
+
+Run as a script, this module is the build step that compiles every
+translations/<locale>/LC_MESSAGES/*.po source into the binary .mo catalog
+that gettext reads. Imported, it provides preload(), which loads the
+catalog of every supported locale into Flask-Babel's process-wide cache at
+startup. Called at import time, that work happens once in the master
+process of a pre-forking server (e.g., gunicorn --preload), and the workers
+share the loaded catalogs copy-on-write instead of each reading and
+parsing them on their first request per locale. CatalogManager builds on
+preload() to reload the catalogs whose files change, without restarting
+the workers.
+
+Usage:
+    ./catalogs.py [translations_directory] [--force]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from babel import Locale, support
+from babel.messages.mofile import write_mo
+from babel.messages.pofile import read_po
+
+TRANSLATIONS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'translations')
+
+
+def compile_catalog(source: str, force: bool = False) -> Optional[str]:
+    """
+    Compiles one .po catalog next to itself if its .mo is missing or stale.
+
+    The .mo file is written to a temporary file of its own and renamed into
+    place, so a running process never reads a partial catalog and several
+    processes compiling at once do not clobber each other's output.
+
+    Args:
+        source (str): The path of the .po file.
+        force (bool): Compile even if the .mo is up to date.
+
+    Returns:
+        Optional[str]: The path of the .mo file written, or None.
+    """
+    target = source[:-3] + '.mo'
+    if (not force and os.path.exists(target) and
+            os.path.getmtime(target) >= os.path.getmtime(source)):
+        return None
+    with open(source, 'rb') as f:
+        catalog = read_po(f)
+    descriptor, temporary = tempfile.mkstemp(
+        dir=os.path.dirname(target), prefix=os.path.basename(target) + '.',
+        suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as f:
+            write_mo(f, catalog)
+        os.replace(temporary, target)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return target
+
+
+def compile_catalogs(directory: str = TRANSLATIONS,
+                     force: bool = False) -> List[str]:
+    """
+    Compiles the .po catalogs of a directory whose .mo is missing or stale.
+
+    Args:
+        directory (str): The translations directory.
+        force (bool): Compile every catalog, even up-to-date ones.
+
+    Returns:
+        List[str]: The paths of the .mo files written.
+    """
+    compiled = []
+    for root, _, files in sorted(os.walk(directory)):
+        for name in sorted(files):
+            if name.endswith('.po'):
+                target = compile_catalog(os.path.join(root, name), force)
+                if target is not None:
+                    compiled.append(target)
+    return compiled
+
+
+def load(directories: Iterable[str], locale: Locale,
+         domain: str = 'messages') -> support.Translations:
+    """
+    Loads and merges the compiled catalogs of a locale.
+
+    This builds the same object Flask-Babel builds on a cache miss.
+
+    Args:
+        directories (Iterable[str]): The translations directories.
+        locale (Locale): The locale to load.
+        domain (str): The message domain.
+
+    Returns:
+        support.Translations: The merged translations.
+    """
+    translations = support.Translations()
+    for dirname in directories:
+        catalog = support.Translations.load(dirname, [locale], domain)
+        translations.merge(catalog)
+        if hasattr(catalog, 'plural'):
+            translations.plural = catalog.plural
+    return translations
+
+
+def preload(app, babel) -> Dict[str, support.Translations]:
+    """
+    Loads the catalog of every locale in LANGUAGES into Flask-Babel's cache.
+
+    Args:
+        app (Flask): The application, whose config has LANGUAGES.
+        babel (Babel): The Flask-Babel extension of the application.
+
+    Returns:
+        Dict[str, support.Translations]: The translations by locale.
+    """
+    domain = babel.domain_instance
+    directories = list(babel.translation_directories)
+    loaded = {}
+    for language in app.config['LANGUAGES']:
+        locale = Locale.parse(language)
+        translations = load(directories, locale, domain.domain)
+        if not translations.files:
+            app.logger.warning("No compiled catalog for %s, run ./catalogs.py",
+                               locale)
+        domain.cache[str(locale), domain.domain] = translations
+        loaded[str(locale)] = translations
+    return loaded
+
+
+Stamp = Tuple[Tuple[str, Optional[int], Optional[int]], ...]
+
+
+class CatalogManager:
+    """
+    Preloads the catalogs of an application and hot-reloads changed ones.
+
+    The .po and .mo files of every locale are polled by modification time
+    and size. When they change, stale .po files are compiled, the locale's
+    catalog is loaded aside and swapped into Flask-Babel's cache with a
+    single dictionary assignment, and on_reload is called with the locale,
+    so only the pages of that locale are dropped. Requests never take a
+    lock to read a catalog: they see either the old or the new one.
+
+    Polling is driven by requests, at most once per interval, because a
+    watcher thread started before a pre-forking server forks does not run
+    in its workers. start_watcher() polls from a thread instead, for
+    processes that do not fork.
+    """
+
+    def __init__(self, app, babel, interval: float = 1.0,
+                 on_reload: Optional[Callable[[str], None]] = None):
+        """
+        Preloads every locale in LANGUAGES and registers the polling hook.
+
+        Args:
+            app (Flask): The application, whose config has LANGUAGES.
+            babel (Babel): The Flask-Babel extension of the application.
+            interval (float): Minimum seconds between two polls.
+            on_reload (Optional[Callable[[str], None]]): Called with each
+                                                         reloaded locale.
+        """
+        self.app = app
+        self.interval = interval
+        self.on_reload = on_reload
+        self.reloads = 0
+        self.domain = babel.domain_instance
+        self.directories = list(babel.translation_directories)
+        self.locales = [str(Locale.parse(language))
+                        for language in app.config['LANGUAGES']]
+        self.stamps: Dict[str, Stamp] = {}
+        for locale in self.locales:
+            # A locale that fails to compile is retried by the next poll
+            self.stamps[locale] = self.stamp(locale) \
+                if self.compile(locale) else ()
+        self.catalogs = preload(app, babel)
+        self._lock = threading.Lock()
+        self._next_poll = time.monotonic() + interval
+        self._watcher = None
+        self._watcher_stop = None
+        app.before_request(self._poll_request)
+
+    def stamp(self, locale: str) -> Stamp:
+        """
+        Modification times and sizes of the catalog files of a locale.
+
+        Args:
+            locale (str): The locale.
+
+        Returns:
+            Stamp: One (path, mtime_ns, size) per file, None when missing.
+        """
+        stamp = []
+        for directory in self.directories:
+            base = os.path.join(directory, locale, 'LC_MESSAGES',
+                                self.domain.domain)
+            for path in (base + '.po', base + '.mo'):
+                try:
+                    stat = os.stat(path)
+                    stamp.append((path, stat.st_mtime_ns, stat.st_size))
+                except OSError:
+                    stamp.append((path, None, None))
+        return tuple(stamp)
+
+    def compile(self, locale: str) -> bool:
+        """
+        Compiles the stale .po catalogs of one locale, logging failures.
+
+        Args:
+            locale (str): The locale.
+
+        Returns:
+            bool: True if every catalog of the locale is compiled.
+        """
+        try:
+            for path, mtime_ns, _ in self.stamp(locale):
+                if path.endswith('.po') and mtime_ns is not None:
+                    compile_catalog(path)
+        except Exception:
+            self.app.logger.exception("Cannot compile the %s catalog", locale)
+            return False
+        return True
+
+    def reload(self, locale: str) -> bool:
+        """
+        Compiles and swaps in the catalog of one locale.
+
+        A catalog that fails to compile or load is logged, and the loaded
+        one is kept.
+
+        Args:
+            locale (str): The locale.
+
+        Returns:
+            bool: True if the new catalog was swapped in.
+        """
+        if not self.compile(locale):
+            return False
+        try:
+            translations = load(self.directories, Locale.parse(locale),
+                                self.domain.domain)
+        except Exception:
+            self.app.logger.exception("Cannot load the %s catalog", locale)
+            return False
+        # Copy-on-write: readers keep whichever dictionary they fetched
+        catalogs = dict(self.catalogs)
+        catalogs[locale] = translations
+        self.catalogs = catalogs
+        self.domain.cache[locale, self.domain.domain] = translations
+        self.reloads += 1
+        if self.on_reload is not None:
+            self.on_reload(locale)
+        return True
+
+    def poll(self) -> List[str]:
+        """
+        Reloads the locales whose catalog files changed.
+
+        A locale whose reload failed keeps its previous stamp, so it is
+        retried by the next poll. Concurrent calls return at once while
+        another one is polling.
+
+        Returns:
+            List[str]: The reloaded locales.
+        """
+        if not self._lock.acquire(blocking=False):
+            return []
+        try:
+            changed = []
+            for locale in self.locales:
+                stamp = self.stamp(locale)
+                if stamp != self.stamps[locale]:
+                    if self.reload(locale):
+                        # Compiling rewrote the .mo, so stamp the files again
+                        self.stamps[locale] = self.stamp(locale)
+                        changed.append(locale)
+            return changed
+        finally:
+            self._next_poll = time.monotonic() + self.interval
+            self._lock.release()
+
+    def _poll_request(self) -> None:
+        """Polls before a request, at most once per interval."""
+        if time.monotonic() >= self._next_poll:
+            self.poll()
+
+    def start_watcher(self, interval: Optional[float] = None) -> None:
+        """
+        Polls periodically in a daemon thread.
+
+        Args:
+            interval (Optional[float]): Seconds between two polls, defaults
+                                        to the manager's interval.
+        """
+        if self._watcher is not None:
+            return
+        self._watcher_stop = threading.Event()
+        interval = self.interval if interval is None else interval
+
+        def run(stop):
+            """Poll until stopped."""
+            while not stop.wait(interval):
+                self.poll()
+
+        self._watcher = threading.Thread(target=run,
+                                         args=(self._watcher_stop,),
+                                         daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        """Stops the watcher thread started by start_watcher."""
+        if self._watcher is None:
+            return
+        self._watcher_stop.set()
+        self._watcher.join()
+        self._watcher = None
+        self._watcher_stop = None
+
+
+if __name__ == '__main__':
+    arguments = [arg for arg in sys.argv[1:] if arg != '--force']
+    for path in compile_catalogs(*arguments[:1],
+                                 force='--force' in sys.argv[1:]):
+        print("compiled {}".format(path))
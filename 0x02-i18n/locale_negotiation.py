@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Locale negotiation module for the i18n Flask applications.
+
+This module provides a LocaleNegotiator that resolves language tags and
+Accept-Language headers against the supported locales. Supported locales
+and their fallbacks are precomputed into a dictionary, and the best match
+of every normalized header is kept in a bounded LRU cache, so a header
+seen before costs one dictionary lookup.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def normalize(tag: str) -> str:
+    """
+    Normalizes a language tag for lookups.
+
+    Args:
+        tag (str): A language tag such as 'fr-CA', 'fr_ca' or ' FR '.
+
+    Returns:
+        str: The tag in lowercase with '-' separators (e.g., 'fr-ca').
+    """
+    return tag.strip().replace('_', '-').lower()
+
+
+def parse_accept_language(header: str) -> List[str]:
+    """
+    Parses an Accept-Language header into tags by decreasing quality.
+
+    Tags with equal quality keep their header order, and tags with an
+    invalid or zero quality are dropped.
+
+    Args:
+        header (str): The header value (e.g., 'fr-CA,fr;q=0.9,en;q=0.8').
+
+    Returns:
+        List[str]: The normalized tags, best first.
+    """
+    weighted: List[Tuple[float, int, str]] = []
+    for position, part in enumerate(header.split(',')):
+        tag, _, params = part.partition(';')
+        tag = normalize(tag)
+        if not tag:
+            continue
+        quality = 1.0
+        params = params.strip().replace(' ', '')
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        if quality > 0:
+            weighted.append((-quality, position, tag))
+    weighted.sort()
+    return [tag for _, _, tag in weighted]
+
+
+class LocaleNegotiator:
+    """
+    Resolves requested locales against a fixed list of supported locales.
+
+    A requested tag matches a supported locale exactly, or through its
+    fallbacks obtained by dropping subtags from the end ('fr-CA' -> 'fr').
+    """
+
+    def __init__(self, supported: Iterable[str], default: str,
+                 cache_size: int = 1024):
+        """
+        Precomputes the lookup table of the supported locales.
+
+        Args:
+            supported (Iterable[str]): The supported locales
+                                       (e.g., ['en', 'fr']).
+            default (str): The locale used for the '*' wildcard.
+            cache_size (int): The maximum number of cached headers.
+        """
+        self.supported = list(supported)
+        self.default = default
+        self.cache_size = cache_size
+        self.table: Dict[str, str] = {}
+        for locale in self.supported:
+            self.table.setdefault(normalize(locale), locale)
+        for locale in self.supported:
+            # A regional locale also serves its bare language
+            language = normalize(locale).split('-', 1)[0]
+            self.table.setdefault(language, locale)
+        self.__cache: 'OrderedDict[str, Optional[str]]' = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def match(self, tag: Optional[str]) -> Optional[str]:
+        """
+        Resolves one language tag, trying its fallbacks in turn.
+
+        Args:
+            tag (Optional[str]): The requested tag (e.g., 'fr-CA').
+
+        Returns:
+            Optional[str]: The supported locale (e.g., 'fr'), or None.
+        """
+        if not tag:
+            return None
+        tag = normalize(tag)
+        while True:
+            locale = self.table.get(tag)
+            if locale is not None or '-' not in tag:
+                return locale
+            tag = tag.rsplit('-', 1)[0]
+
+    def best_match(self, header: Optional[str]) -> Optional[str]:
+        """
+        Resolves an Accept-Language header, using the LRU cache.
+
+        Args:
+            header (Optional[str]): The Accept-Language header value.
+
+        Returns:
+            Optional[str]: The best supported locale, or None if nothing
+                           in the header is supported.
+        """
+        if not header:
+            return None
+        key = header.replace(' ', '').lower()
+        with self.__lock:
+            if key in self.__cache:
+                self.__cache.move_to_end(key)
+                return self.__cache[key]
+        locale = None
+        for tag in parse_accept_language(key):
+            locale = self.default if tag == '*' else self.match(tag)
+            if locale is not None:
+                break
+        with self.__lock:
+            self.__cache[key] = locale
+            if len(self.__cache) > self.cache_size:
+                self.__cache.popitem(last=False)
+        return locale
+
+    def negotiate(self, *candidates: Optional[str],
+                  header: Optional[str] = None) -> str:
+        """
+        Returns the first supported candidate, else the header's best match,
+        else the default locale.
+
+        Args:
+            candidates (Optional[str]): Explicit choices by priority, such as
+                                        the 'locale' query parameter, then
+                                        the user's setting.
+            header (Optional[str]): The Accept-Language header value.
+
+        Returns:
+            str: The selected locale.
+        """
+        for candidate in candidates:
+            locale = self.match(candidate)
+            if locale is not None:
+                return locale
+        locale = self.best_match(header)
+        return self.default if locale is None else locale
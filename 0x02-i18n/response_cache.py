@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Rendered response cache module for the i18n Flask applications.
+
+This module provides a ResponseCache that keeps rendered page bodies in a
+bounded LRU cache, keyed by what the page depends on (e.g., locale,
+timezone and user), and serves them with an ETag so that clients holding
+the current version get a 304 Not Modified without a body.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+from flask import Response, current_app, request
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of rendered bodies and their ETags.
+
+    Keys are tuples whose first item is the locale, so the pages of one
+    locale can be dropped when its translation catalog changes. Every
+    response varies on Accept-Language, since the locale may come from it.
+    """
+
+    def __init__(self, max_items: int = 256):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_items (int): The maximum number of cached pages.
+        """
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self.__pages: 'OrderedDict[Tuple, Tuple[bytes, str]]' = OrderedDict()
+        self.__generation = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__pages)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Tuple[bytes, str]]:
+        """
+        Retrieves a cached page.
+
+        Args:
+            key (Tuple[Hashable, ...]): The page key, locale first.
+
+        Returns:
+            Optional[Tuple[bytes, str]]: The body and its ETag, or None.
+        """
+        with self.__lock:
+            entry = self.__pages.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.__pages.move_to_end(key)
+            return entry
+
+    def put(self, key: Tuple[Hashable, ...], body: bytes,
+            generation: Optional[int] = None) -> Tuple[bytes, str]:
+        """
+        Caches a page, evicting the least recently used one if full.
+
+        Args:
+            key (Tuple[Hashable, ...]): The page key, locale first.
+            body (bytes): The rendered body.
+            generation (Optional[int]): The generation read before
+                                        rendering; the page is not cached
+                                        if an invalidation happened since.
+
+        Returns:
+            Tuple[bytes, str]: The body and its ETag.
+        """
+        entry = (body, hashlib.sha1(body).hexdigest())
+        with self.__lock:
+            if generation is None or generation == self.__generation:
+                self.__pages[key] = entry
+                self.__pages.move_to_end(key)
+                if len(self.__pages) > self.max_items:
+                    self.__pages.popitem(last=False)
+        return entry
+
+    def invalidate(self, locale: Optional[str] = None) -> int:
+        """
+        Drops the cached pages of a locale, or every page.
+
+        Args:
+            locale (Optional[str]): The locale whose pages are dropped, None
+                                    for all of them.
+
+        Returns:
+            int: The number of pages dropped.
+        """
+        with self.__lock:
+            self.__generation += 1
+            if locale is None:
+                keys = list(self.__pages)
+            else:
+                keys = [key for key in self.__pages if key[0] == locale]
+            for key in keys:
+                del self.__pages[key]
+            return len(keys)
+
+    def respond(self, key: Tuple[Hashable, ...],
+                render: Callable[[], str]) -> Response:
+        """
+        Serves a page from the cache, rendering it on a miss.
+
+        Args:
+            key (Tuple[Hashable, ...]): The page key, locale first.
+            render (Callable[[], str]): Renders the page.
+
+        Returns:
+            Response: The page with its ETag, or a 304 Not Modified if the
+                      request's If-None-Match has the current ETag.
+        """
+        entry = self.get(key)
+        if entry is None:
+            generation = self.__generation
+            entry = self.put(key, render().encode(), generation)
+        body, etag = entry
+        response = current_app.response_class(body, mimetype='text/html')
+        response.set_etag(etag)
+        response.vary.add('Accept-Language')
+        return response.make_conditional(request)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Timezone resolution module for the i18n Flask applications.
+
+This module provides a TimezoneResolver that checks timezone names
+against the tz database names loaded once at startup, instead of calling
+pytz.timezone and catching UnknownTimeZoneError. Resolved tzinfo objects,
+and the misses for unknown names, are kept in a bounded LRU cache.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import tzinfo
+from typing import Dict, Optional
+
+import pytz
+
+
+class TimezoneResolver:
+    """
+    Resolves timezone names to pytz tzinfo objects.
+
+    Names match case-insensitively, as with pytz.timezone. Unknown names
+    such as 'Vulcan' resolve to None and are cached like any other name,
+    so a repeated bogus value never reaches the tz database again.
+    """
+
+    def __init__(self, default: str = 'UTC', cache_size: int = 1024):
+        """
+        Preloads the valid zone names.
+
+        Args:
+            default (str): The timezone returned when no candidate is valid.
+            cache_size (int): The maximum number of cached names.
+        """
+        self.names: Dict[str, str] = {name.lower(): name
+                                      for name in pytz.all_timezones}
+        self.cache_size = cache_size
+        self.__cache: 'OrderedDict[str, Optional[tzinfo]]' = OrderedDict()
+        self.__lock = threading.Lock()
+        self.default = self.resolve(default)
+        assert self.default is not None, "default must be a valid timezone"
+
+    def resolve(self, name: Optional[str]) -> Optional[tzinfo]:
+        """
+        Resolves one timezone name, using the LRU cache.
+
+        Args:
+            name (Optional[str]): The timezone name (e.g., 'Europe/Paris').
+
+        Returns:
+            Optional[tzinfo]: The timezone, or None if the name is unknown.
+        """
+        if not name:
+            return None
+        with self.__lock:
+            if name in self.__cache:
+                self.__cache.move_to_end(name)
+                return self.__cache[name]
+        zone = self.names.get(name.lower())
+        timezone = None if zone is None else pytz.timezone(zone)
+        with self.__lock:
+            self.__cache[name] = timezone
+            if len(self.__cache) > self.cache_size:
+                self.__cache.popitem(last=False)
+        return timezone
+
+    def select(self, *candidates: Optional[str]) -> tzinfo:
+        """
+        Returns the timezone of the first valid candidate.
+
+        Args:
+            candidates (Optional[str]): Timezone names by priority, such as
+                                        the 'timezone' query parameter, then
+                                        the user's setting.
+
+        Returns:
+            tzinfo: The selected timezone, or the default one.
+        """
+        for candidate in candidates:
+            timezone = self.resolve(candidate)
+            if timezone is not None:
+                return timezone
+        return self.default